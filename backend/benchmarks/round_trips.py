@@ -0,0 +1,79 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import sqlalchemy as sa
+
+from src.database import async_session_maker, engine
+from src.models.services import Service
+from src.models.users import User
+from src.repositories.entries import EntryRepository
+from src.repositories.posts import PostRepository
+from src.repositories.services import ServiceRepository
+from src.repositories.socials import SocialRepository
+from src.repositories.users import UserRepository
+from src.schemas.entries import EntryCreate, EntryUpdatePartial
+from src.schemas.posts import PostCreate, PostUpdatePartial
+from src.schemas.services import ServiceCreate, ServiceUpdatePartial
+from src.schemas.socials import SocialCreate, SocialUpdatePartial
+from src.schemas.users import UserCreate, UserUpdatePartial
+
+
+statements: list[str] = []
+
+
+@sa.event.listens_for(engine.sync_engine, 'before_cursor_execute')
+def count(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    statements.append(statement.split(None, 1)[0])
+
+
+async def measure(name: str, write: Callable[[], Awaitable[Any]]) -> Any:
+    statements.clear()
+    result = await write()
+    print(f'{name:<16} {len(statements):>3}  {" ".join(statements)}')
+    return result
+
+
+async def main() -> None:
+    suffix = uuid4().hex[:8]
+    when = date.today() + timedelta(days=30)
+    async with async_session_maker() as session:
+        users, socials = UserRepository(session), SocialRepository(session)
+        services, posts, entries = ServiceRepository(session), PostRepository(session), EntryRepository(session)
+        user_data = UserCreate(
+            username=f'bench{suffix}',
+            email=f'bench{suffix}@example.com',
+            password='bench#Pass1',
+            confirm_password='bench#Pass1',
+        )
+        user = await measure('user create', lambda: users.create(user_data))
+        await measure('user update', lambda: users.update(user, UserUpdatePartial(username=f'b{suffix}'), True))
+        social = await measure('social create', lambda: socials.create(SocialCreate(user_id=user.uuid)))
+        await measure('social update', lambda: socials.update(social, SocialUpdatePartial(first_name='Bench'), True))
+        service = await measure(
+            'service create', lambda: services.create(ServiceCreate(name=f'bench {suffix}', duration=30))
+        )
+        await measure('service update', lambda: services.update(service, ServiceUpdatePartial(duration=60), True))
+        post = await measure(
+            'post create',
+            lambda: posts.create(PostCreate(author_id=user.uuid, title=f'bench {suffix}', image='x.jpg', content='..')),
+        )
+        await measure('post update', lambda: posts.update(post, PostUpdatePartial(content='bench'), True))
+        entry = await measure(
+            'entry create',
+            lambda: entries.create(EntryCreate(date=when, time=time(10), services=[service.uuid]), user_id=user.uuid),
+        )
+        await measure(
+            'entry update',
+            lambda: entries.update(entry, EntryUpdatePartial(date=when, time=time(11)), exclude_unset=True),
+        )
+        await session.execute(sa.delete(User).filter_by(uuid=user.uuid))
+        await session.execute(sa.delete(Service).filter_by(uuid=service.uuid))
+        await session.commit()
+    await engine.dispose()
+    print(f'finished at {datetime.now():%H:%M:%S}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
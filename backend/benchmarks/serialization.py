@@ -0,0 +1,84 @@
+import contextlib
+import time
+from datetime import date, datetime, timedelta
+from datetime import time as dtime
+from importlib import import_module
+from typing import Any, Callable
+from unittest import mock
+from uuid import uuid4
+
+import src.main  # noqa: F401
+from src.models.entries import Entry
+from src.models.services import Service
+from src.models.users import User
+from src.schemas.entries import EntryRead
+from src.schemas.users import UserRead
+
+
+ROUNDS = 200
+PAGE_SIZE = 50
+SCHEMA_MODULES = ['src.schemas.users', 'src.schemas.entries', 'src.schemas.services']
+
+
+def route_lookup(module_name: str, endpoint: str = 'get_one', **path_params: Any) -> str:
+    router = getattr(import_module(f'src.api.v1.{module_name}'), 'router')
+    return f'/api{router.url_path_for(endpoint, **path_params)}'
+
+
+def page() -> tuple[list[Entry], list[User]]:
+    now = datetime.now()
+    services = [Service(uuid=uuid4(), name=f'service {i}', duration=30, created=now, updated=now) for i in range(3)]
+    users = [
+        User(
+            uuid=uuid4(),
+            username=f'user{i}',
+            email=f'user{i}@example.com',
+            confirmed=True,
+            active=True,
+            admin=False,
+            created=now,
+            updated=now,
+        )
+        for i in range(PAGE_SIZE)
+    ]
+    entries = [
+        Entry(
+            uuid=uuid4(),
+            date=date.today() + timedelta(days=i),
+            time=dtime(10),
+            user=user,
+            services=services,
+            completed=False,
+            created=now,
+            updated=now,
+        )
+        for i, user in enumerate(users)
+    ]
+    return entries, users
+
+
+def timed(serialize: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        serialize()
+    return (time.perf_counter() - start) / ROUNDS * 1e3
+
+
+def main() -> None:
+    entries, users = page()
+    pages: dict[str, Callable[[], Any]] = {
+        'entries page': lambda: [EntryRead.model_validate(entry).model_dump(mode='json') for entry in entries],
+        'users page': lambda: [UserRead.model_validate(user).model_dump(mode='json') for user in users],
+    }
+    print(f'{"page of " + str(PAGE_SIZE):<14} {"lookup ms":>10} {"template ms":>12} {"speedup":>8}')
+    for name, serialize in pages.items():
+        with contextlib.ExitStack() as stack:
+            for module in SCHEMA_MODULES:
+                stack.enter_context(mock.patch(f'{module}.get_url', route_lookup))
+            before = timed(serialize)
+        after = timed(serialize)
+        print(f'{name:<14} {before:>10.2f} {after:>12.2f} {before / after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from datetime import date
+from datetime import time as dtime
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import sqlalchemy as sa
+
+import src.models.posts  # noqa: F401
+import src.models.socials  # noqa: F401
+from src.database import async_session_maker, engine
+from src.models.entries import Entry
+from src.models.services import Service
+from src.models.users import User
+from src.repositories.entries import neighbours_query, services_query
+from src.repositories.users import UserRepository
+
+
+ROUNDS = 2000
+
+uuid, uuids, day, hour = uuid4(), [uuid4() for _ in range(3)], date.today(), dtime(10)
+
+inline: dict[str, Callable[[], sa.Select[Any]]] = {
+    'find_by_uuid': lambda: sa.select(User).filter_by(uuid=uuid),
+    'find_one': lambda: sa.select(User).filter_by(username='bench'),
+    'neighbours': lambda: sa.select(Entry).filter(
+        Entry.date == day,
+        Entry.uuid.in_(
+            sa.select(
+                sa.union_all(
+                    sa.select(Entry.uuid)
+                    .filter(Entry.date == day, Entry.time <= hour, Entry.uuid != uuid)
+                    .order_by(Entry.time.desc())
+                    .limit(1),
+                    sa.select(Entry.uuid).filter(Entry.date == day, Entry.time > hour).order_by(Entry.time).limit(1),
+                )
+                .subquery()
+                .c.uuid
+            )
+        ),
+    ),
+    'services': lambda: sa.select(Service).filter(Service.uuid.in_(uuids)),
+}
+cached: dict[str, tuple[sa.Select[Any], dict[str, Any]]] = {
+    'find_by_uuid': (UserRepository.select_by('uuid'), {'uuid': uuid}),
+    'find_one': (UserRepository.select_by('username'), {'username': 'bench'}),
+    'neighbours': (neighbours_query, {'date': day, 'time': hour, 'uuid': uuid}),
+    'services': (services_query, {'uuids': uuids}),
+}
+
+
+def build(name: str) -> float:
+    make = inline[name]
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        make()._generate_cache_key()
+    inline_cost = time.perf_counter() - start
+    statement = cached[name][0]
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        statement._generate_cache_key()
+    return inline_cost / (time.perf_counter() - start)
+
+
+async def timed(run: Callable[[], Awaitable[Any]]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await run()
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+async def main() -> None:
+    print(f'{"query":<14} {"inline us":>10} {"cached us":>10} {"build x":>8}')
+    async with async_session_maker() as session:
+        for name, make in inline.items():
+            statement, params = cached[name]
+            await session.scalar(make())
+            await session.scalar(statement, params)
+            before = await timed(lambda: session.scalar(make()))
+            after = await timed(lambda: session.scalar(statement, params))
+            print(f'{name:<14} {before:>10.1f} {after:>10.1f} {build(name):>8.1f}')
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -5,6 +5,7 @@ from .v1.entries import router as entries_router_v1
 from .v1.posts import router as posts_router_v1
 from .v1.services import router as services_router_v1
 from .v1.socials import router as socials_router_v1
+from .v1.stats import router as stats_router_v1
 from .v1.users import router as users_router_v1
 
 
@@ -14,4 +15,5 @@ router_v1.include_router(entries_router_v1)
 router_v1.include_router(posts_router_v1)
 router_v1.include_router(services_router_v1)
 router_v1.include_router(socials_router_v1)
+router_v1.include_router(stats_router_v1)
 router_v1.include_router(users_router_v1)
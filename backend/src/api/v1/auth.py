@@ -5,7 +5,16 @@ from fastapi.logger import logger
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from src.api.v1.dependencies import check_disposable, get_current_user
+from src.api.v1.dependencies import (
+    bcrypt_limit,
+    check_disposable,
+    email_limit,
+    get_current_user,
+    login_limit,
+    register_limit,
+    resend_limit,
+)
+from src.database import SessionRoute
 from src.models.users import User
 from src.repositories.auth import AuthRepository
 from src.repositories.redis import RedisRepository
@@ -17,13 +26,14 @@ from src.utils import AccountAction
 router = APIRouter(
     prefix='/v1/auth',
     tags=['auth'],
+    route_class=SessionRoute,
 )
 
 
 @router.post(
     '/register',
     status_code=status.HTTP_201_CREATED,
-    dependencies=[Depends(check_disposable)],
+    dependencies=[Depends(register_limit), Depends(check_disposable)],
     response_model=UserRead,
     responses={status.HTTP_400_BAD_REQUEST: {'description': 'Disposable domains are not allowed'}},
 )
@@ -44,6 +54,7 @@ async def register(
 @router.post(
     '/resend-activation',
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(resend_limit)],
     response_class=JSONResponse,
     responses={status.HTTP_400_BAD_REQUEST: {'description': 'Account already confirmed.'}},
 )
@@ -69,6 +80,7 @@ async def resend_activation(
 @router.post(
     '/resend-confirmation',
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(resend_limit)],
     response_class=JSONResponse,
     responses={status.HTTP_400_BAD_REQUEST: {'description': 'Account already confirmed.'}},
 )
@@ -148,7 +160,7 @@ async def confirm_email_change(
 @router.post(
     '/forgot-password',
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(check_disposable)],
+    dependencies=[Depends(email_limit), Depends(check_disposable)],
     response_class=JSONResponse,
     responses={status.HTTP_400_BAD_REQUEST: {'description': 'Disposable domains are not allowed'}},
 )
@@ -177,7 +189,7 @@ async def forgot_password(
 @router.put(
     '/reset-password',
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(check_disposable)],
+    dependencies=[Depends(bcrypt_limit), Depends(check_disposable)],
     response_class=JSONResponse,
     responses={status.HTTP_400_BAD_REQUEST: {'description': 'The confirmation token is invalid or has expired.'}},
 )
@@ -195,7 +207,12 @@ async def reset_password(
     )
 
 
-@router.post('/token', status_code=status.HTTP_200_OK, response_model=Token)
+@router.post(
+    '/token',
+    status_code=status.HTTP_200_OK,
+    response_model=Token,
+    dependencies=[Depends(login_limit), Depends(bcrypt_limit)],
+)
 async def token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_repo: AuthRepository = Depends(),
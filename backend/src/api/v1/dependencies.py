@@ -1,16 +1,104 @@
-from fastapi import Depends, HTTPException, status
-from fastapi_mail.email_utils import DefaultChecker
+import time
+from collections.abc import AsyncGenerator
+
+from fastapi import Depends, HTTPException, Request, status
 from pydantic import UUID4
-from redis.asyncio import Redis
 
+from src.core.config import config
+from src.database import QueryBudget
 from src.models.entries import Entry
 from src.models.users import User
 from src.repositories.auth import AuthRepository, EmailRequest, ResetRequest, oauth2_scheme
 from src.repositories.entries import EntryRepository
-from src.repositories.redis import get_redis
+from src.repositories.redis import disposable_domains, is_rate_limited, rate_limiter
 from src.repositories.users import UserRepository, UserSchema
 from src.schemas.users import UserCreate, UserRead
-from src.utils import HTTP_403_FORBIDDEN
+from src.utils import HTTP_403_FORBIDDEN, HTTP_429_TOO_MANY_REQUESTS, RateLimitKey
+
+
+class RateLimit:
+    registry: list['RateLimit'] = []
+
+    def __init__(
+        self,
+        name: str,
+        max_requests: int,
+        window: int,
+        *,
+        key: RateLimitKey = RateLimitKey.IP,
+        cost: int = 1,
+    ) -> None:
+        self.name = name
+        self.max_requests = max_requests
+        self.window = window
+        self.key = key
+        self.cost = cost
+        RateLimit.registry.append(self)
+
+    def with_cost(self, cost: int) -> 'RateLimit':
+        return RateLimit(self.name, self.max_requests, self.window, key=self.key, cost=cost)
+
+    async def identify(self, request: Request) -> str:
+        if self.key is RateLimitKey.USER:
+            scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+            if scheme.lower() == 'bearer' and token:
+                try:
+                    return f'user:{AuthRepository.validate_token(token).uuid}'
+                except HTTPException:
+                    pass
+        elif self.key is RateLimitKey.ACCOUNT:
+            username = (await request.form()).get('username')
+            if isinstance(username, str) and username:
+                return f'account:{username.lower()}'
+        return f'ip:{request.client.host if request.client else "127.0.0.1"}'
+
+    async def __call__(self, request: Request) -> None:
+        key = f'rate_limit:{self.name}:{await self.identify(request)}'
+        if await is_rate_limited(key, self.max_requests, self.window, self.cost):
+            raise HTTP_429_TOO_MANY_REQUESTS
+
+
+class FailedLoginLimit(RateLimit):
+    def __init__(self, name: str, max_requests: int, window: int) -> None:
+        super().__init__(name, max_requests, window, key=RateLimitKey.ACCOUNT)
+
+    async def identify_account(self, request: Request, repo: UserRepository) -> str:
+        login = (await request.form()).get('username')
+        if not isinstance(login, str) or not login:
+            return await self.identify(request)
+        for field in ('username', 'email'):
+            try:
+                user = await repo.find_one(**{field: login})
+            except HTTPException:
+                continue
+            return f'account:{user.uuid}'
+        return f'account:{login.lower()}'
+
+    async def __call__(  # type: ignore[override]
+        self, request: Request, repo: UserRepository = Depends()
+    ) -> AsyncGenerator[None, None]:
+        identity = await self.identify_account(request, repo)
+        key = f'rate_limit:{self.name}:{identity}:{int(time.time()) // self.window}'
+        if await rate_limiter.count(key) >= self.max_requests:
+            raise HTTP_429_TOO_MANY_REQUESTS
+        try:
+            yield
+        except HTTPException as exc:
+            if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+                await rate_limiter.hit(key, self.window, self.cost)
+            raise
+
+
+heavy_ip_limit = RateLimit('heavy', config.HEAVY_REQUESTS_BUDGET, config.HEAVY_REQUESTS_WINDOW)
+heavy_user_limit = RateLimit('heavy', config.HEAVY_REQUESTS_BUDGET, config.HEAVY_REQUESTS_WINDOW, key=RateLimitKey.USER)
+login_limit = FailedLoginLimit('login', config.LOGIN_MAX_ATTEMPTS, config.LOGIN_ATTEMPTS_WINDOW)
+bcrypt_limit = heavy_ip_limit.with_cost(config.BCRYPT_REQUEST_COST)
+email_limit = heavy_ip_limit.with_cost(config.EMAIL_REQUEST_COST)
+register_limit = heavy_ip_limit.with_cost(config.BCRYPT_REQUEST_COST + config.EMAIL_REQUEST_COST)
+password_limit = heavy_user_limit.with_cost(config.BCRYPT_REQUEST_COST)
+resend_limit = heavy_user_limit.with_cost(config.EMAIL_REQUEST_COST)
+upload_limit = heavy_user_limit.with_cost(config.UPLOAD_REQUEST_COST)
+entry_update_budget = QueryBudget(config.QUERY_BUDGET + 2)
 
 
 async def get_current_user(
@@ -62,18 +150,8 @@ async def validate_entry(
     return entry
 
 
-async def default_checker(redis: Redis = Depends(get_redis)) -> DefaultChecker:
-    checker = DefaultChecker(db_provider='redis')
-    checker.redis_client = redis
-    await checker.init_redis()
-    return checker
-
-
-async def check_disposable(
-    user_data: UserSchema | UserCreate | EmailRequest | ResetRequest,
-    checker: DefaultChecker = Depends(default_checker),
-) -> None:
-    if user_data.email is not None and await checker.is_disposable(user_data.email):
+async def check_disposable(user_data: UserSchema | UserCreate | EmailRequest | ResetRequest) -> None:
+    if user_data.email is not None and user_data.email in disposable_domains:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='Disposable domains are not allowed',
@@ -4,21 +4,25 @@ from fastapi import APIRouter, Depends, Response, status
 from fastapi.logger import logger
 from fastapi_cache.decorator import cache
 from fastapi_filter import FilterDepends
-from fastapi_pagination.links import Page
 
 from src.api.v1.dependencies import (
+    entry_update_budget,
     get_active_user,
     get_admin_user,
     get_confirmed_user,
     get_current_user,
     validate_entry,
 )
+from src.database import SessionRoute
 from src.models.entries import Entry
 from src.models.users import User
+from src.pagination import Page
 from src.repositories.entries import EntryRepository
+from src.schemas.base import BulkResult
 from src.schemas.entries import (
     EntryAdminUpdate,
     EntryAdminUpdatePartial,
+    EntryBulkUpdate,
     EntryCreate,
     EntryFilter,
     EntryInfo,
@@ -36,6 +40,7 @@ router = APIRouter(
         Depends(get_active_user),
         Depends(get_confirmed_user),
     ],
+    route_class=SessionRoute,
 )
 
 
@@ -69,6 +74,43 @@ async def get_all(
     return await repo.find_all(entry_filter)
 
 
+@router.patch(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def patch_many(
+    entry_data: EntryBulkUpdate,
+    entry_filter: EntryFilter = FilterDepends(EntryFilter),
+    repo: EntryRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_update(entry_filter, entry_data.model_dump(exclude_none=True))
+    logger.info(f'[patch entries][admin]: {affected} {entry_data}')
+    return BulkResult(affected=affected)
+
+
+@router.delete(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def delete_many(
+    entry_filter: EntryFilter = FilterDepends(EntryFilter),
+    repo: EntryRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_delete(entry_filter)
+    logger.info(f'[delete entries][admin]: {affected}')
+    return BulkResult(affected=affected)
+
+
 @router.get(
     '/date/{date}',
     status_code=status.HTTP_200_OK,
@@ -96,6 +138,7 @@ async def get_one(entry: Entry = Depends(validate_entry)) -> EntryRead:
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=EntryRead,
+    dependencies=[Depends(entry_update_budget)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -114,6 +157,7 @@ async def update_one(
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=EntryRead,
+    dependencies=[Depends(entry_update_budget)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -132,7 +176,7 @@ async def patch_one(
     '/{uuid}/edit',
     status_code=status.HTTP_200_OK,
     response_model=EntryRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(entry_update_budget)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -151,7 +195,7 @@ async def update_one_admin(
     '/{uuid}/edit',
     status_code=status.HTTP_200_OK,
     response_model=EntryRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(entry_update_budget)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -1,22 +1,26 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Query, Response, UploadFile, status
+from fastapi.background import BackgroundTasks
 from fastapi.logger import logger
 from fastapi.responses import FileResponse
 from fastapi_cache.decorator import cache
 from fastapi_filter import FilterDepends
-from fastapi_pagination.links import Page
 from pydantic import UUID4
 
-from src.api.v1.dependencies import get_active_user, get_admin_user, get_current_user
+from src.api.v1.dependencies import get_active_user, get_admin_user, get_current_user, upload_limit
+from src.database import SessionRoute
 from src.models.users import User
+from src.pagination import Page
 from src.repositories.posts import PostRepository
+from src.schemas.base import BulkResult
 from src.schemas.posts import (
     PostAdminUpdate,
     PostAdminUpdatePartial,
     PostCreate,
     PostFilter,
     PostRead,
+    PostSearchRead,
 )
 
 
@@ -24,6 +28,7 @@ router = APIRouter(
     prefix='/v1/posts',
     tags=['posts'],
     dependencies=[Depends(get_current_user), Depends(get_active_user)],
+    route_class=SessionRoute,
 )
 
 
@@ -31,7 +36,7 @@ router = APIRouter(
     '/',
     status_code=status.HTTP_201_CREATED,
     response_model=PostRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(upload_limit)],
     responses={
         status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {'description': 'Too large'},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {'description': 'Unsupported file type'},
@@ -63,6 +68,34 @@ async def get_all(
     return await repo.find_all(post_filter)
 
 
+@router.delete(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def delete_many(
+    background_tasks: BackgroundTasks,
+    post_filter: PostFilter = FilterDepends(PostFilter),
+    repo: PostRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_delete(post_filter, background_tasks)
+    logger.info(f'[delete posts]: {affected}')
+    return BulkResult(affected=affected)
+
+
+@router.get('/search', status_code=status.HTTP_200_OK, response_model=Page[PostSearchRead])
+@cache()
+async def search(
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    repo: PostRepository = Depends(),
+) -> Page[PostSearchRead]:
+    return await repo.search(q.strip())
+
+
 @router.get('/{uuid}', status_code=status.HTTP_200_OK, response_model=PostRead)
 @cache()
 async def get_one(
@@ -83,7 +116,7 @@ async def get_post_image(uuid: UUID4 | str, repo: PostRepository = Depends()) ->
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=PostRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(upload_limit)],
     responses={
         status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {'description': 'Too large'},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {'description': 'Unsupported file type'},
@@ -109,7 +142,7 @@ async def update_one(
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=PostRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(upload_limit)],
     responses={
         status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {'description': 'Too large'},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {'description': 'Unsupported file type'},
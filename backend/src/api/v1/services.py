@@ -2,16 +2,19 @@ from fastapi import APIRouter, Depends, Response, status
 from fastapi.logger import logger
 from fastapi_cache.decorator import cache
 from fastapi_filter import FilterDepends
-from fastapi_pagination.links import Page
 from pydantic import UUID4
 
 from src.api.v1.dependencies import get_active_user, get_admin_user, get_current_user
+from src.database import SessionRoute
+from src.pagination import Page
 from src.repositories.entries import EntryRepository
 from src.repositories.services import ServiceRepository
+from src.schemas.base import BulkResult
 from src.schemas.entries import EntryRead
 from src.schemas.services import (
     ServiceAdminUpdate,
     ServiceAdminUpdatePartial,
+    ServiceBulkUpdate,
     ServiceCreate,
     ServiceFilter,
     ServiceRead,
@@ -22,6 +25,7 @@ router = APIRouter(
     prefix='/v1/services',
     tags=['services'],
     dependencies=[Depends(get_current_user), Depends(get_active_user)],
+    route_class=SessionRoute,
 )
 
 
@@ -54,6 +58,43 @@ async def get_all(
     return await repo.find_all(service_filter)
 
 
+@router.patch(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def patch_many(
+    service_data: ServiceBulkUpdate,
+    service_filter: ServiceFilter = FilterDepends(ServiceFilter),
+    repo: ServiceRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_update(service_filter, service_data.model_dump(exclude_none=True))
+    logger.info(f'[patch services]: {affected} {service_data}')
+    return BulkResult(affected=affected)
+
+
+@router.delete(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def delete_many(
+    service_filter: ServiceFilter = FilterDepends(ServiceFilter),
+    repo: ServiceRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_delete(service_filter)
+    logger.info(f'[delete services]: {affected}')
+    return BulkResult(affected=affected)
+
+
 @router.get('/{uuid}', status_code=status.HTTP_200_OK, response_model=ServiceRead)
 @cache()
 async def get_one(uuid: UUID4, repo: ServiceRepository = Depends()) -> ServiceRead:
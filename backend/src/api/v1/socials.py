@@ -2,10 +2,11 @@ from fastapi import APIRouter, Depends, status
 from fastapi.logger import logger
 from fastapi_cache.decorator import cache
 from fastapi_filter import FilterDepends
-from fastapi_pagination.links import Page
 from pydantic import UUID4
 
 from src.api.v1.dependencies import get_active_user, get_admin_user, get_current_user
+from src.database import SessionRoute
+from src.pagination import Page
 from src.repositories.socials import SocialRepository
 from src.schemas.socials import (
     SocialAdminUpdate,
@@ -23,6 +24,7 @@ router = APIRouter(
         Depends(get_active_user),
         Depends(get_admin_user),
     ],
+    route_class=SessionRoute,
 )
 
 
@@ -0,0 +1,32 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.v1.dependencies import get_admin_user, get_current_user
+from src.database import SessionRoute
+from src.repositories.stats import StatsRepository
+from src.schemas.stats import Stats
+
+
+router = APIRouter(
+    prefix='/v1/stats',
+    tags=['stats'],
+    dependencies=[Depends(get_current_user), Depends(get_admin_user)],
+    route_class=SessionRoute,
+)
+
+
+@router.get(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=Stats,
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def get_stats(
+    start: date | None = None,
+    end: date | None = None,
+    repo: StatsRepository = Depends(),
+) -> Stats:
+    return await repo.get_stats(start, end)
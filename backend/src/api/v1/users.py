@@ -4,7 +4,6 @@ from fastapi.logger import logger
 from fastapi.responses import FileResponse
 from fastapi_cache.decorator import cache
 from fastapi_filter import FilterDepends
-from fastapi_pagination.links import Page
 from pydantic import UUID4
 
 from src.api.v1.dependencies import (
@@ -13,13 +12,18 @@ from src.api.v1.dependencies import (
     get_admin_user,
     get_confirmed_user,
     get_current_user,
+    password_limit,
+    upload_limit,
 )
+from src.database import SessionRoute
 from src.models.users import User
+from src.pagination import Page
 from src.repositories.auth import AuthRepository
 from src.repositories.entries import EntryRepository
 from src.repositories.posts import PostRepository
 from src.repositories.socials import SocialRepository
 from src.repositories.users import UserRepository
+from src.schemas.base import BulkResult
 from src.schemas.entries import EntryRead
 from src.schemas.posts import PostRead
 from src.schemas.socials import (
@@ -32,6 +36,7 @@ from src.schemas.socials import (
 from src.schemas.users import (
     UserAdminUpdate,
     UserAdminUpdatePartial,
+    UserBulkUpdate,
     UserFilter,
     UserRead,
     UserUpdate,
@@ -43,6 +48,7 @@ router = APIRouter(
     prefix='/v1/users',
     tags=['users'],
     dependencies=[Depends(get_current_user), Depends(get_active_user)],
+    route_class=SessionRoute,
 )
 
 
@@ -63,6 +69,43 @@ async def get_all(
     return await repo.find_all(user_filter)
 
 
+@router.patch(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def patch_many(
+    user_data: UserBulkUpdate,
+    user_filter: UserFilter = FilterDepends(UserFilter),
+    repo: UserRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_update(user_filter, user_data.model_dump(exclude_none=True))
+    logger.info(f'[patch users][admin]: {affected} {user_data}')
+    return BulkResult(affected=affected)
+
+
+@router.delete(
+    '/',
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    dependencies=[Depends(get_admin_user)],
+    responses={
+        status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
+    },
+)
+async def delete_many(
+    user_filter: UserFilter = FilterDepends(UserFilter),
+    repo: UserRepository = Depends(),
+) -> BulkResult:
+    affected = await repo.bulk_delete(user_filter)
+    logger.info(f'[delete users][admin]: {affected}')
+    return BulkResult(affected=affected)
+
+
 @router.get('/me', status_code=status.HTTP_200_OK, response_model=UserRead)
 @cache()
 async def get_me(user: UserRead = Depends(get_current_user)) -> UserRead:
@@ -73,7 +116,7 @@ async def get_me(user: UserRead = Depends(get_current_user)) -> UserRead:
     '/me',
     status_code=status.HTTP_200_OK,
     response_model=UserRead,
-    dependencies=[Depends(check_disposable)],
+    dependencies=[Depends(password_limit), Depends(check_disposable)],
     responses={
         status.HTTP_400_BAD_REQUEST: {'description': 'Disposable domains are not allowed'},
     },
@@ -99,7 +142,7 @@ async def update_me(
     '/me',
     status_code=status.HTTP_200_OK,
     response_model=UserRead,
-    dependencies=[Depends(check_disposable)],
+    dependencies=[Depends(password_limit), Depends(check_disposable)],
     responses={
         status.HTTP_400_BAD_REQUEST: {'description': 'Disposable domains are not allowed'},
     },
@@ -199,7 +242,7 @@ async def get_my_avatar(
     '/me/socials/avatar',
     status_code=status.HTTP_200_OK,
     response_model=SocialRead,
-    dependencies=[Depends(get_confirmed_user)],
+    dependencies=[Depends(get_confirmed_user), Depends(upload_limit)],
     responses={
         status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {'description': 'Too large'},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {'description': 'Unsupported file type'},
@@ -245,7 +288,7 @@ async def get_one(uuid: UUID4 | str, repo: UserRepository = Depends()) -> UserRe
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=UserRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(password_limit)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -265,7 +308,7 @@ async def update_one(
     '/{uuid}',
     status_code=status.HTTP_200_OK,
     response_model=UserRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(password_limit)],
     responses={
         status.HTTP_403_FORBIDDEN: {'description': 'You are not allowed to perform this operation'},
     },
@@ -411,7 +454,7 @@ async def get_user_avatar(
     '/{uuid}/socials/avatar',
     status_code=status.HTTP_200_OK,
     response_model=SocialRead,
-    dependencies=[Depends(get_admin_user)],
+    dependencies=[Depends(get_admin_user), Depends(upload_limit)],
     responses={
         status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {'description': 'Too large'},
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {'description': 'Unsupported file type'},
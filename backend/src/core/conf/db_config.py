@@ -9,6 +9,24 @@ class DBConfig(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DSN: str | None = None
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 100
+    POSTGRES_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+    POSTGRES_COMMAND_TIMEOUT: float = 60
+    POSTGRES_STATEMENT_TIMEOUT: int = 30000
+    POSTGRES_APPLICATION_NAME: str = 'juliyanails'
+    POSTGRES_REPLICA_DSNS: list[str] = []
+    POSTGRES_PRIMARY_PIN_SECONDS: int = 5
+    POSTGRES_COUNT_ESTIMATE_THRESHOLD: int = 100000
+    QUERY_BUDGET: int = 8
+    QUERY_REPEAT_THRESHOLD: int = 3
+    QUERY_BUDGET_ENFORCE: bool = False
+    ENTRY_PARTITIONS_AHEAD: int = 12
+    ENTRY_ARCHIVE_AFTER_MONTHS: int = 12
     TZ: str
     PGTZ: str
     PGADMIN_DEFAULT_EMAIL: str
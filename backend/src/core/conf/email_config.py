@@ -13,3 +13,4 @@ class EmailConfig(BaseSettings):
     MAIL_FROM_NAME: str
     USE_CREDENTIALS: bool
     SUPPRESS_SEND: int = 0
+    DISPOSABLE_DOMAINS_REFRESH_INTERVAL: int = 300
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import RedisDsn, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
@@ -9,6 +11,28 @@ class RedisConfig(BaseSettings):
     REDIS_PASSWORD: str = ''
     REDIS_HASH: str
     REDIS_DSN: str | None = None
+    REDIS_MODE: Literal['standalone', 'sentinel', 'cluster'] = 'standalone'
+    REDIS_SENTINELS: list[str] = []
+    REDIS_SENTINEL_MASTER: str = 'mymaster'
+    REDIS_CLUSTER_NODES: list[str] = []
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5
+    REDIS_CONNECT_TIMEOUT: float = 2
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_KEEPALIVE: bool = True
+    REDIS_RETRIES: int = 3
+    REDIS_BACKOFF_BASE: float = 0.01
+    REDIS_BACKOFF_CAP: float = 0.5
+    REDIS_BREAKER_THRESHOLD: int = 5
+    REDIS_BREAKER_RECOVERY: float = 30
+    REDIS_RATE_LIMIT_TIMEOUT: float = 0.05
+    REDIS_RATE_LIMIT_FAIL_OPEN: bool = True
+    REDIS_CACHE_TIMEOUT: float = 0.1
+    REDIS_CACHE_FAIL_OPEN: bool = True
+    REDIS_TOKENS_TIMEOUT: float = 0.5
+    REDIS_TOKENS_FAIL_OPEN: bool = False
+    REDIS_EMAIL_TIMEOUT: float = 0.5
+    REDIS_EMAIL_FAIL_OPEN: bool = True
 
     @field_validator('REDIS_DSN', mode='after')
     @classmethod
@@ -28,8 +28,22 @@ class ServerConfig(BaseSettings):
     IMAGE_SIZE: int = 2097152
     ACCEPTED_FILE_TYPES: list[str] = ['image/png', 'image/jpeg', 'image/jpg', 'png', 'jpeg', 'jpg']
     CACHE_EXPIRE: int = 60
-    MAX_REQUESTS: int = 5
+    COUNT_CACHE_EXPIRE: int = 30
+    SEARCH_MIN_LENGTH: int = 3
+    STATS_REFRESH_INTERVAL: int = 300
+    MAX_REQUESTS: int = 60
     MAX_REQUESTS_WINDOW: int = 60
+    HEAVY_REQUESTS_BUDGET: int = 100
+    HEAVY_REQUESTS_WINDOW: int = 60
+    BCRYPT_REQUEST_COST: int = 10
+    EMAIL_REQUEST_COST: int = 15
+    UPLOAD_REQUEST_COST: int = 20
+    LOGIN_MAX_ATTEMPTS: int = 5
+    LOGIN_ATTEMPTS_WINDOW: int = 300
+    RATE_LIMIT_LOCAL: bool = True
+    RATE_LIMIT_SYNC_INTERVAL: int = 50
+    RATE_LIMIT_ERROR_BOUND: float = 0.1
+    RATE_LIMIT_WORKERS: int = 1
     TEMPLATE_FOLDER: str = 'templates'
     FRONTEND_HOST: str = 'http://127.0.0.1:4000'
     LOGGING: dict[str, Any] = get_logging_config(ROOT_DIR / 'core/conf/logging.yaml')
@@ -1,19 +1,214 @@
-from typing import AsyncGenerator
+import random
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Coroutine
 
+import sqlalchemy as sa
 import sqlalchemy.orm as so
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request, Response
+from fastapi.logger import logger
+from fastapi.routing import APIRoute
+from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from src.core.config import config
+from src.metrics import metrics
+from src.repositories.redis import primary_pins
+
+
+pool_checked_out = metrics.gauge('db_pool_checked_out', 'Connections currently checked out of the pool')
+pool_overflow = metrics.gauge('db_pool_overflow', 'Connections opened above the pool size')
+pool_connections = metrics.counter('db_pool_connections_total', 'New database connections opened by the pool')
+pool_wait = metrics.summary('db_pool_wait_seconds', 'Time spent waiting for a pool connection')
+request_queries = metrics.summary('db_request_queries', 'SQL statements issued per request')
+query_budget_exceeded = metrics.counter(
+    'db_query_budget_exceeded_total', 'Requests that issued more queries than allowed'
+)
+repeated_queries = metrics.counter(
+    'db_repeated_queries_total', 'Requests that repeated a statement with new parameters'
+)
 
 
 class Base(so.DeclarativeBase):
     pass
 
 
-engine = create_async_engine(config.POSTGRES_DSN)
-async_session_maker = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryLog:
+    def __init__(self, route: str, budget: int | None = None) -> None:
+        self.route = route
+        self.budget = config.QUERY_BUDGET if budget is None else budget
+        self.statements: Counter[str] = Counter()
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def repeated(self) -> dict[str, int]:
+        return {
+            statement: count for statement, count in self.statements.items() if count >= config.QUERY_REPEAT_THRESHOLD
+        }
+
+    def problems(self) -> list[str]:
+        problems = []
+        if self.count > self.budget:
+            query_budget_exceeded.inc(route=self.route)
+            problems.append(f'{self.count} queries, budget {self.budget}')
+        for statement, count in self.repeated().items():
+            repeated_queries.inc(route=self.route)
+            problems.append(f'{count} x {" ".join(statement.split())[:200]}')
+        return problems
+
+    def check(self) -> None:
+        request_queries.observe(self.count, route=self.route)
+        problems = self.problems()
+        if not problems:
+            return
+        message = f'{self.route}: ' + '; '.join(problems)
+        if config.QUERY_BUDGET_ENFORCE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(f'[query budget]: {message}')
+
+
+query_log: ContextVar[QueryLog | None] = ContextVar('query_log', default=None)
+
+
+class QueryBudget:
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+
+    async def __call__(self) -> None:
+        log = query_log.get()
+        if log is not None:
+            log.budget = self.budget
+
+
+@sa.event.listens_for(sa.Engine, 'before_cursor_execute')
+def record_query(conn: sa.Connection, cursor: Any, statement: str, *args: Any) -> None:
+    log = query_log.get()
+    if log is not None:
+        log.statements[statement] += 1
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait.observe(time.perf_counter() - start)
+
+
+def create_engine(dsn: str) -> AsyncEngine:
+    engine = create_async_engine(
+        dsn,
+        poolclass=InstrumentedPool,
+        pool_size=config.POSTGRES_POOL_SIZE,
+        max_overflow=config.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=config.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=config.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=config.POSTGRES_POOL_PRE_PING,
+        connect_args={
+            'statement_cache_size': config.POSTGRES_STATEMENT_CACHE_SIZE,
+            'prepared_statement_cache_size': config.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE,
+            'command_timeout': config.POSTGRES_COMMAND_TIMEOUT,
+            'server_settings': {
+                'statement_timeout': str(config.POSTGRES_STATEMENT_TIMEOUT),
+                'application_name': config.POSTGRES_APPLICATION_NAME,
+            },
+        },
+    )
+    pool = engine.sync_engine.pool
 
+    def on_connect(*args: Any) -> None:
+        pool_connections.inc()
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
+    def on_checkout(*args: Any) -> None:
+        pool_checked_out.inc()
+        pool_overflow.set(max(pool.overflow(), 0))  # type: ignore[attr-defined]
+
+    def on_checkin(*args: Any) -> None:
+        pool_checked_out.dec()
+        pool_overflow.set(max(pool.overflow(), 0))  # type: ignore[attr-defined]
+
+    sa.event.listen(pool, 'connect', on_connect)
+    sa.event.listen(pool, 'checkout', on_checkout)
+    sa.event.listen(pool, 'checkin', on_checkin)
+    return engine
+
+
+engine = create_engine(config.POSTGRES_DSN)
+replica_engines = [create_engine(dsn) for dsn in config.POSTGRES_REPLICA_DSNS]
+
+
+class RoutingSession(so.Session):
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> sa.Engine | sa.Connection:
+        if (
+            self.info.get('replica')
+            and replica_engines
+            and not self._flushing
+            and isinstance(clause, sa.Select)
+            and clause._for_update_arg is None
+        ):
+            return random.choice(replica_engines).sync_engine
+        return engine.sync_engine
+
+
+async_session_maker = async_sessionmaker(
+    engine, sync_session_class=RoutingSession, expire_on_commit=False, autoflush=False
+)
+
+
+def identify(request: Request) -> str:
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() == 'bearer' and token:
+        try:
+            return f'user:{jwt.get_unverified_claims(token)["sub"]}'
+        except (JWTError, KeyError):
+            pass
+    return f'ip:{request.client.host if request.client else "127.0.0.1"}'
+
+
+async def use_replica(request: Request) -> bool:
+    if not replica_engines:
+        return False
+    identity = identify(request)
+    if request.method not in ('GET', 'HEAD'):
+        await primary_pins.pin(identity)
+        return False
+    return not await primary_pins.is_pinned(identity)
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with async_session_maker(info={'replica': await use_replica(request)}) as session:
+        request.state.session = session
         yield session
+
+
+async def release_session(request: Request) -> None:
+    session: AsyncSession | None = getattr(request.state, 'session', None)
+    if session is not None:
+        await session.close()
+
+
+class SessionRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def release_after(request: Request) -> Response:
+            log = QueryLog(f'{request.method} {self.path_format}')
+            token = query_log.set(log)
+            try:
+                response = await handler(request)
+            finally:
+                query_log.reset(token)
+                await release_session(request)
+            log.check()
+            return response
+
+        return release_after
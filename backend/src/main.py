@@ -4,17 +4,27 @@ from datetime import datetime, timezone
 from fastapi import Depends, FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
 from fastapi_pagination import add_pagination
 from redis.asyncio import Redis
 from sqlalchemy import text
 
 from src.api import router_v1
+from src.api.v1.dependencies import get_admin_user
 from src.core.config import config
-from src.database import AsyncSession, get_async_session
-from src.repositories.redis import RateLimitMiddleware, get_redis
+from src.database import AsyncSession, engine, get_async_session
+from src.metrics import metrics
+from src.repositories.redis import (
+    GuardedRedisBackend,
+    RateLimitMiddleware,
+    close_redis,
+    disposable_domains,
+    get_redis,
+    local_rate_limiter,
+    request_key_builder,
+)
+from src.repositories.stats import stats_refresher
 
 
 app = FastAPI(
@@ -61,15 +71,30 @@ async def internal_exception_handler(request: Request, exc: Exception) -> JSONRe
 @app.on_event('startup')
 async def startup() -> None:
     FastAPICache.init(
-        RedisBackend(get_redis()),
+        GuardedRedisBackend(get_redis()),
         prefix='fastapi-cache',
         expire=config.CACHE_EXPIRE,
+        key_builder=request_key_builder,
     )
 
+    if config.RATE_LIMIT_LOCAL:
+        local_rate_limiter.start()
+    await disposable_domains.start()
+    stats_refresher.start()
+
     logging.config.dictConfig(config.LOGGING)
     app.state.start_time = datetime.now(tz=timezone.utc)
 
 
+@app.on_event('shutdown')
+async def shutdown() -> None:
+    await local_rate_limiter.stop()
+    await disposable_domains.stop()
+    await stats_refresher.stop()
+    await engine.dispose()
+    await close_redis()
+
+
 @app.get(
     '/',
     status_code=status.HTTP_307_TEMPORARY_REDIRECT,
@@ -103,3 +128,14 @@ async def healthcheck(
             },
         ),
     )
+
+
+@app.get(
+    '/metrics',
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+    dependencies=[Depends(get_admin_user)],
+    include_in_schema=False,
+)
+def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render())
@@ -0,0 +1,97 @@
+from typing import Any
+
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+class Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self.values: dict[LabelSet, float] = {}
+
+    @staticmethod
+    def labelset(labels: dict[str, Any]) -> LabelSet:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def get(self, **labels: Any) -> float:
+        return self.values.get(self.labelset(labels), 0)
+
+    def samples(self) -> list[tuple[str, LabelSet, float]]:
+        return [(self.name, labels, value) for labels, value in self.values.items()]
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} {self.kind}']
+        for name, labels, value in self.samples():
+            label_str = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{label_str}}} {value}' if label_str else f'{name} {value}')
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self.labelset(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value: float, **labels: Any) -> None:
+        self.values[self.labelset(labels)] = value
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Summary(Metric):
+    kind = 'summary'
+
+    def __init__(self, name: str, description: str) -> None:
+        super().__init__(name, description)
+        self.counts: dict[LabelSet, int] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self.labelset(labels)
+        self.values[key] = self.values.get(key, 0) + value
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def count(self, **labels: Any) -> int:
+        return self.counts.get(self.labelset(labels), 0)
+
+    def samples(self) -> list[tuple[str, LabelSet, float]]:
+        return [
+            sample
+            for labels, value in self.values.items()
+            for sample in (
+                (f'{self.name}_sum', labels, value),
+                (f'{self.name}_count', labels, self.counts[labels]),
+            )
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Any:
+        return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self.register(Counter(name, description))
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        return self.register(Gauge(name, description))
+
+    def summary(self, name: str, description: str) -> Summary:
+        return self.register(Summary(name, description))
+
+    def render(self) -> str:
+        return '\n'.join(metric.render() for metric in self.metrics.values()) + '\n'
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,53 @@
+"""added stats views
+
+Revision ID: a7e5c2d9f143
+Revises: d4f0b8c6e317
+Create Date: 2026-10-19 13:00:05.117902
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e5c2d9f143'
+down_revision = 'd4f0b8c6e317'
+branch_labels: str | None = None
+depends_on: str | None = None
+
+VIEWS = {
+    'stats_daily_entries': (
+        'SELECT entry.date AS date, count(*) AS entries, count(CASE WHEN entry.completed THEN 1 END) AS completed '
+        'FROM entry GROUP BY entry.date',
+        'date',
+    ),
+    'stats_daily_services': (
+        'SELECT entry.date AS date, service.uuid AS service_id, count(*) AS entries, '
+        'sum(service.duration) AS minutes FROM entry '
+        'JOIN association_table ON association_table.entry_id = entry.uuid '
+        'JOIN service ON service.uuid = association_table.service_id GROUP BY entry.date, service.uuid',
+        'date, service_id',
+    ),
+    'stats_weekly_users': (
+        'SELECT CAST(date_trunc(\'week\', "user".created) AS DATE) AS week, count(*) AS count '
+        'FROM "user" GROUP BY CAST(date_trunc(\'week\', "user".created) AS DATE)',
+        'week',
+    ),
+    'stats_weekly_posts': (
+        "SELECT CAST(date_trunc('week', post.created) AS DATE) AS week, count(*) AS count "
+        "FROM post GROUP BY CAST(date_trunc('week', post.created) AS DATE)",
+        'week',
+    ),
+    'stats_refreshed': ('SELECT 1 AS id, now() AS refreshed', 'id'),
+}
+
+
+def upgrade() -> None:
+    for name, (query, unique) in VIEWS.items():
+        op.execute(f'CREATE MATERIALIZED VIEW {name} AS {query}')
+        op.execute(f'CREATE UNIQUE INDEX ix_{name}_unique ON {name} ({unique})')
+
+
+def downgrade() -> None:
+    for name in reversed(VIEWS):
+        op.execute(f'DROP MATERIALIZED VIEW {name}')
@@ -0,0 +1,126 @@
+"""partitioned entry by month
+
+Revision ID: e3b8f1a6c054
+Revises: a7e5c2d9f143
+Create Date: 2026-10-19 14:00:11.402317
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b8f1a6c054'
+down_revision = 'a7e5c2d9f143'
+branch_labels: str | None = None
+depends_on: str | None = None
+
+COLUMNS = 'uuid, created, updated, date, time, user_id, completed'
+VIEWS = {
+    'stats_daily_entries': (
+        'SELECT entry.date AS date, count(*) AS entries, count(CASE WHEN entry.completed THEN 1 END) AS completed '
+        'FROM entry GROUP BY entry.date',
+        'date',
+    ),
+    'stats_daily_services': (
+        'SELECT entry.date AS date, service.uuid AS service_id, count(*) AS entries, '
+        'sum(service.duration) AS minutes FROM entry '
+        'JOIN association_table ON association_table.entry_id = entry.uuid '
+        'JOIN service ON service.uuid = association_table.service_id GROUP BY entry.date, service.uuid',
+        'date, service_id',
+    ),
+}
+MONTHLY_PARTITIONS = """
+DO $$
+DECLARE month date;
+BEGIN
+    FOR month IN SELECT DISTINCT CAST(date_trunc('month', date) AS DATE) FROM entry_unpartitioned LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF entry FOR VALUES FROM (%L) TO (%L)',
+            to_char(month, '"entry_y"YYYY"m"MM'), month, CAST(month + interval '1 month' AS DATE)
+        );
+    END LOOP;
+END $$
+"""
+
+
+def create_entry_table(**kw: str) -> None:
+    op.create_table(
+        'entry',
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.Time(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('completed', sa.Boolean(), server_default='false', nullable=False),
+        sa.Column('uuid', sa.UUID(), nullable=False),
+        sa.Column('created', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['user_id'], ['user.uuid'], name='entry_user_id_fkey', onupdate='CASCADE', ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint(*(['date', 'uuid'] if kw else ['uuid'])),
+        **kw,
+    )
+
+
+def create_views() -> None:
+    for name, (query, unique) in VIEWS.items():
+        op.execute(f'CREATE MATERIALIZED VIEW {name} AS {query}')
+        op.execute(f'CREATE UNIQUE INDEX ix_{name}_unique ON {name} ({unique})')
+
+
+def drop_views() -> None:
+    for name in reversed(VIEWS):
+        op.execute(f'DROP MATERIALIZED VIEW {name}')
+
+
+def swap_entry_table(**kw: str) -> None:
+    drop_views()
+    op.drop_index('ix_entry_user_id_created_uuid', table_name='entry')
+    op.drop_index('ix_entry_created_uuid', table_name='entry')
+    op.rename_table('entry', 'entry_unpartitioned')
+    op.execute('ALTER TABLE entry_unpartitioned RENAME CONSTRAINT entry_pkey TO entry_unpartitioned_pkey')
+    op.execute(
+        'ALTER TABLE entry_unpartitioned RENAME CONSTRAINT entry_user_id_fkey TO entry_unpartitioned_user_id_fkey'
+    )
+    create_entry_table(**kw)
+
+
+def fill_entry_table() -> None:
+    op.execute(f'INSERT INTO entry ({COLUMNS}) SELECT {COLUMNS} FROM entry_unpartitioned')
+    op.drop_table('entry_unpartitioned')
+    op.create_index('ix_entry_created_uuid', 'entry', ['created', 'uuid'], unique=False)
+    op.create_index('ix_entry_user_id_created_uuid', 'entry', ['user_id', 'created', 'uuid'], unique=False)
+
+
+def upgrade() -> None:
+    op.drop_constraint('association_table_entry_id_fkey', 'association_table', type_='foreignkey')
+    op.add_column('association_table', sa.Column('entry_date', sa.Date(), nullable=True))
+    op.execute(
+        'UPDATE association_table SET entry_date = entry.date FROM entry WHERE entry.uuid = association_table.entry_id'
+    )
+    swap_entry_table(postgresql_partition_by='RANGE (date)')
+    op.execute('CREATE TABLE entry_default PARTITION OF entry DEFAULT')
+    op.execute(MONTHLY_PARTITIONS)
+    fill_entry_table()
+    op.create_foreign_key(
+        'association_table_entry_fkey',
+        'association_table',
+        'entry',
+        ['entry_id', 'entry_date'],
+        ['uuid', 'date'],
+        onupdate='CASCADE',
+        ondelete='CASCADE',
+    )
+    create_views()
+
+
+def downgrade() -> None:
+    op.drop_constraint('association_table_entry_fkey', 'association_table', type_='foreignkey')
+    swap_entry_table()
+    fill_entry_table()
+    op.drop_column('association_table', 'entry_date')
+    op.create_foreign_key(
+        'association_table_entry_id_fkey', 'association_table', 'entry', ['entry_id'], ['uuid'], ondelete='CASCADE'
+    )
+    create_views()
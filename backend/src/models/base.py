@@ -13,11 +13,24 @@ from src.database import Base
 association_table = sa.Table(
     'association_table',
     Base.metadata,
-    sa.Column('entry_id', pg_UUID(as_uuid=True), sa.ForeignKey('entry.uuid', ondelete='CASCADE')),
+    sa.Column('entry_id', pg_UUID(as_uuid=True)),
+    sa.Column('entry_date', sa.Date),
     sa.Column('service_id', pg_UUID(as_uuid=True), sa.ForeignKey('service.uuid', ondelete='SET NULL')),
+    sa.ForeignKeyConstraint(
+        ['entry_id', 'entry_date'],
+        ['entry.uuid', 'entry.date'],
+        name='association_table_entry_fkey',
+        ondelete='CASCADE',
+        onupdate='CASCADE',
+    ),
 )
 
 
+@sa.event.listens_for(Base.metadata, 'before_create')
+def create_extensions(target: sa.MetaData, connection: sa.Connection, **kw: Any) -> None:
+    connection.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+
+
 class BaseDBModel(Base):
     __abstract__ = True
 
@@ -29,6 +42,14 @@ class BaseDBModel(Base):
         sa.DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
+    __mapper_args__ = {'eager_defaults': True}
+
+    __table_options__: dict[str, Any] = {}
+
+    @so.declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (sa.Index(f'ix_{cls.__tablename__}_created_uuid', 'created', 'uuid'), cls.__table_options__)
+
     def as_dict(self) -> dict[str, Any]:
         return {k: v for k, v in self.__dict__.items() if not k.startswith('__') and not callable(k)}
 
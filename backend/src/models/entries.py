@@ -1,4 +1,5 @@
 from datetime import date, datetime, time, timedelta
+from typing import Any
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -12,11 +13,13 @@ from src.models.users import User
 
 class Entry(BaseDBModel):
     __tablename__ = 'entry'
+    __table_options__ = {'postgresql_partition_by': 'RANGE (date)'}
+    __mapper_args__ = {'eager_defaults': True, 'primary_key': ['uuid']}
 
     services: so.Mapped[list['Service']] = so.relationship(
         secondary=association_table, back_populates='entries', lazy='selectin'
     )
-    date: so.Mapped['date'] = so.mapped_column(sa.Date, nullable=False)
+    date: so.Mapped['date'] = so.mapped_column(sa.Date, primary_key=True)
     time: so.Mapped['time'] = so.mapped_column(sa.Time, nullable=False)
     user_id: so.Mapped[UUID] = so.mapped_column(
         pg_UUID(as_uuid=True), sa.ForeignKey('user.uuid', ondelete='CASCADE', onupdate='CASCADE'), nullable=False
@@ -38,3 +41,11 @@ class Entry(BaseDBModel):
 
     def __repr__(self) -> str:
         return f'Entry({self.uuid}, {self.date}, {self.time}, {self.user})'
+
+
+sa.Index('ix_entry_user_id_created_uuid', Entry.user_id, Entry.created, Entry.uuid)
+
+
+@sa.event.listens_for(Entry.__table__, 'after_create')
+def create_default_partition(target: sa.Table, connection: sa.Connection, **kw: Any) -> None:
+    connection.execute(sa.text('CREATE TABLE IF NOT EXISTS entry_default PARTITION OF entry DEFAULT'))
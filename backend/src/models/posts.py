@@ -1,13 +1,22 @@
+from typing import Any
 from uuid import UUID
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as pg_UUID
 
 from src.models.base import BaseDBModel
 from src.models.users import User
 
 
+SEARCH_CONFIG = 'simple'
+
+
+def search_query(text: str) -> sa.Function[Any]:
+    return sa.func.websearch_to_tsquery(SEARCH_CONFIG, text)
+
+
 class Post(BaseDBModel):
     __tablename__ = 'post'
 
@@ -18,6 +27,24 @@ class Post(BaseDBModel):
         pg_UUID(as_uuid=True), sa.ForeignKey('user.uuid', ondelete='CASCADE', onupdate='CASCADE'), nullable=False
     )
     author: so.Mapped['User'] = so.relationship(back_populates='posts', lazy='joined', innerjoin=True)
+    search_vector = sa.Column(
+        TSVECTOR,
+        sa.Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', content), 'B')",
+            persisted=True,
+        ),
+    )
+    rank: so.Mapped[float | None] = so.query_expression()
+    snippet: so.Mapped[str | None] = so.query_expression()
+
+    __mapper_args__ = {'eager_defaults': True, 'exclude_properties': ['search_vector']}
 
     def __repr__(self) -> str:
         return f'Post({self.uuid}, {self.title}, {self.author})'
+
+
+sa.Index('ix_post_author_id_created_uuid', Post.author_id, Post.created, Post.uuid)
+sa.Index('ix_post_title_lower', sa.func.lower(Post.title), unique=True)
+sa.Index('ix_post_search_vector', Post.search_vector, postgresql_using='gin')
+sa.Index('ix_post_title_trgm', Post.title, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
@@ -21,3 +21,6 @@ class Service(BaseDBModel):
 
     def __repr__(self) -> str:
         return f'Service({self.uuid}, {self.name}, {self.duration})'
+
+
+sa.Index('ix_service_name_lower', sa.func.lower(Service.name), unique=True)
@@ -0,0 +1,90 @@
+from typing import Any
+
+import sqlalchemy as sa
+
+from src.database import Base
+from src.models.base import association_table
+from src.models.entries import Entry
+from src.models.posts import Post
+from src.models.services import Service
+from src.models.users import User
+
+
+class MaterializedView:
+    def __init__(self, name: str, query: sa.Select[Any], unique: list[str]) -> None:
+        self.name = name
+        self.query = query
+        self.unique = unique
+        self.table = sa.table(name, *(sa.column(str(column.key), column.type) for column in query.selected_columns))
+        self.c = self.table.c
+
+    def create(self, connection: sa.Connection) -> None:
+        query = self.query.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True})
+        connection.execute(sa.text(f'CREATE MATERIALIZED VIEW IF NOT EXISTS {self.name} AS {query}'))
+        connection.execute(
+            sa.text(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS ix_{self.name}_unique ON {self.name} ({", ".join(self.unique)})'
+            )
+        )
+
+    def drop(self, connection: sa.Connection) -> None:
+        connection.execute(sa.text(f'DROP MATERIALIZED VIEW IF EXISTS {self.name}'))
+
+    def refresh(self) -> sa.TextClause:
+        return sa.text(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {self.name}')
+
+
+def week(column: Any) -> sa.Cast[Any]:
+    return sa.cast(sa.func.date_trunc('week', column), sa.Date)
+
+
+stats_daily_entries = MaterializedView(
+    'stats_daily_entries',
+    sa.select(
+        Entry.date.label('date'),
+        sa.func.count().label('entries'),
+        sa.func.count(sa.case((Entry.completed, 1))).label('completed'),
+    ).group_by(Entry.date),
+    ['date'],
+)
+stats_daily_services = MaterializedView(
+    'stats_daily_services',
+    sa.select(
+        Entry.date.label('date'),
+        Service.uuid.label('service_id'),
+        sa.func.count().label('entries'),
+        sa.func.sum(Service.duration).label('minutes'),
+    )
+    .join(association_table, association_table.c.entry_id == Entry.uuid)
+    .join(Service, Service.uuid == association_table.c.service_id)
+    .group_by(Entry.date, Service.uuid),
+    ['date', 'service_id'],
+)
+stats_weekly_users = MaterializedView(
+    'stats_weekly_users',
+    sa.select(week(User.created).label('week'), sa.func.count().label('count')).group_by(week(User.created)),
+    ['week'],
+)
+stats_weekly_posts = MaterializedView(
+    'stats_weekly_posts',
+    sa.select(week(Post.created).label('week'), sa.func.count().label('count')).group_by(week(Post.created)),
+    ['week'],
+)
+stats_refreshed = MaterializedView(
+    'stats_refreshed',
+    sa.select(sa.literal(1).label('id'), sa.func.now().label('refreshed')),
+    ['id'],
+)
+STATS_VIEWS = [stats_daily_entries, stats_daily_services, stats_weekly_users, stats_weekly_posts, stats_refreshed]
+
+
+@sa.event.listens_for(Base.metadata, 'after_create')
+def create_stats_views(target: sa.MetaData, connection: sa.Connection, **kw: Any) -> None:
+    for view in STATS_VIEWS:
+        view.create(connection)
+
+
+@sa.event.listens_for(Base.metadata, 'before_drop')
+def drop_stats_views(target: sa.MetaData, connection: sa.Connection, **kw: Any) -> None:
+    for view in reversed(STATS_VIEWS):
+        view.drop(connection)
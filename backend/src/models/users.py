@@ -44,3 +44,9 @@ class User(BaseDBModel):
 
     def __repr__(self) -> str:
         return f'User({self.uuid}, {self.username}, {self.email})'
+
+
+sa.Index('ix_user_username_lower', sa.func.lower(User.username), unique=True)
+sa.Index('ix_user_email_lower', sa.func.lower(User.email), unique=True)
+sa.Index('ix_user_username_trgm', User.username, postgresql_using='gin', postgresql_ops={'username': 'gin_trgm_ops'})
+sa.Index('ix_user_email_trgm', User.email, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
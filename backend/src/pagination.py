@@ -0,0 +1,201 @@
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime, time
+from math import ceil
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+import sqlalchemy as sa
+from fastapi import HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi_pagination.api import create_page, resolve_params
+from fastapi_pagination.bases import AbstractParams
+from fastapi_pagination.default import Params as DefaultParams
+from fastapi_pagination.links import Page as LinksPage
+from fastapi_pagination.links.bases import create_links
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.metrics import metrics
+from src.repositories.redis import count_cache
+
+
+T = TypeVar('T')
+
+DEFAULT_ORDER = ('created',)
+TIEBREAKER = 'uuid'
+
+page_counts = metrics.counter('pagination_counts_total', 'Page totals by count strategy')
+
+
+class Params(DefaultParams):
+    cursor: str | None = Query(None, description='Keyset cursor, pass an empty value to start from the first page')
+    include_total: bool = Query(True, description='Set to false to skip counting total and pages')
+
+
+class Page(LinksPage[T], Generic[T]):
+    next_cursor: str | None = None
+
+    __params_type__ = Params
+
+
+def ordering(order_by: Sequence[str] | None) -> list[tuple[str, bool]]:
+    keys = [(name.lstrip('+-'), name.startswith('-')) for name in order_by or DEFAULT_ORDER]
+    if TIEBREAKER not in (name for name, _ in keys):
+        keys.append((TIEBREAKER, False))
+    return keys
+
+
+def encode_cursor(keys: list[tuple[str, bool]], item: Any) -> str:
+    payload = {'k': [f'-{name}' if desc else name for name, desc in keys], 'v': [getattr(item, n) for n, _ in keys]}
+    return base64.urlsafe_b64encode(json.dumps(jsonable_encoder(payload)).encode()).decode()
+
+
+def decode_cursor(keys: list[tuple[str, bool]], columns: list[sa.Column[Any]], cursor: str) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload['k'] != [f'-{name}' if desc else name for name, desc in keys]:
+            raise ValueError(payload['k'])
+        return [load_value(column, value) for column, value in zip(columns, payload['v'], strict=True)]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid cursor')
+
+
+def load_value(column: sa.Column[Any], value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type in (datetime, date, time):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def after(keys: list[tuple[str, bool]], columns: list[sa.Column[Any]], values: list[Any]) -> sa.ColumnElement[bool]:
+    bound = [sa.literal(value, column.type) for column, value in zip(columns, values)]
+    if len({desc for _, desc in keys}) == 1:
+        row, cursor_row = sa.tuple_(*columns), sa.tuple_(*bound)
+        return row < cursor_row if keys[0][1] else row > cursor_row
+    clauses = []
+    for i, ((_, desc), column, value) in enumerate(zip(keys, columns, bound)):
+        equal = [c == v for c, v in zip(columns[:i], bound[:i])]
+        clauses.append(sa.and_(*equal, column < value if desc else column > value))
+    return sa.or_(*clauses)
+
+
+def count_key(session: AsyncSession, query: sa.Select[Any]) -> str:
+    compiled = query.compile(dialect=session.get_bind().dialect)
+    return hashlib.sha1(f'{compiled}:{sorted(compiled.params.items())}'.encode()).hexdigest()
+
+
+async def count(session: AsyncSession, query: sa.Select[Any]) -> int:
+    query = query.order_by(None)
+    if query.whereclause is None:
+        table = query.column_descriptions[0]['entity'].__table__.name
+        estimate = await session.scalar(
+            sa.text('SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(quote_ident(:table))'),
+            {'table': table},
+        )
+        if estimate is not None and estimate >= config.POSTGRES_COUNT_ESTIMATE_THRESHOLD:
+            page_counts.inc(strategy='estimate')
+            return int(estimate)
+    key = count_key(session, query)
+    total = await count_cache.get(key)
+    if total is not None:
+        page_counts.inc(strategy='cached')
+        return total
+    total = await session.scalar(sa.select(sa.func.count()).select_from(query.subquery())) or 0
+    page_counts.inc(strategy='exact')
+    await count_cache.set(key, total)
+    return total
+
+
+async def fetch(session: AsyncSession, query: sa.Select[Any], size: int) -> tuple[Sequence[Any], bool]:
+    rows = (await session.scalars(query.limit(size + 1))).unique().all()
+    return rows[:size], len(rows) > size
+
+
+def page_params() -> Params:
+    params: AbstractParams = resolve_params()
+    if not isinstance(params, Params):
+        raise TypeError('Page should be used with src.pagination.Params')
+    return params
+
+
+async def paginate(
+    session: AsyncSession,
+    query: sa.Select[Any],
+    order_by: Sequence[str] | None = None,
+    transformer: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+) -> Any:
+    keys = ordering(order_by)
+    model = query.column_descriptions[0]['entity']
+    mapper_columns = sa.inspect(model).columns
+    columns = [mapper_columns[name] for name, _ in keys]
+    query = query.order_by(*(column.desc() if desc else column.asc() for column, (_, desc) in zip(columns, keys)))
+    params = page_params()
+    if params.cursor is None:
+        return await offset_page(session, query, params, transformer)
+
+    for column, (name, _) in zip(columns, keys):
+        if column.nullable:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'Cursor pagination does not support ordering by {name}',
+            )
+    if params.cursor:
+        query = query.filter(after(keys, columns, decode_cursor(keys, columns, params.cursor)))
+    items, has_next = await fetch(session, query, params.size)
+    next_cursor = encode_cursor(keys, items[-1]) if has_next else None
+    return create_page(
+        transformer(items) if transformer else items,
+        params=params,
+        next_cursor=next_cursor,
+        links=create_links(
+            first={'cursor': ''},
+            last=None,  # type: ignore[arg-type]
+            next={'cursor': next_cursor} if next_cursor else None,
+            prev=None,
+        ),
+    )
+
+
+async def paginate_ordered(
+    session: AsyncSession,
+    query: sa.Select[Any],
+    transformer: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+) -> Any:
+    params = page_params()
+    if params.cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Cursor pagination is not supported for this ordering',
+        )
+    return await offset_page(session, query, params, transformer)
+
+
+async def offset_page(
+    session: AsyncSession,
+    query: sa.Select[Any],
+    params: Params,
+    transformer: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+) -> Any:
+    offset = params.size * (params.page - 1)
+    items, has_next = await fetch(session, query.offset(offset), params.size)
+    total = None
+    if not params.include_total:
+        page_counts.inc(strategy='skipped')
+    elif not has_next and (items or not offset):
+        page_counts.inc(strategy='page')
+        total = offset + len(items)
+    else:
+        total = await count(session, query)
+    return create_page(
+        transformer(items) if transformer else items,
+        params=params,
+        total=total,
+        links=create_links(
+            first={'page': 1},
+            last={'page': max(ceil(total / params.size), 1)} if total is not None else None,  # type: ignore[arg-type]
+            next={'page': params.page + 1} if has_next else None,
+            prev={'page': params.page - 1} if params.page > 1 else None,
+        ),
+    )
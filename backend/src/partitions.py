@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import contextlib
+import re
+from datetime import date, timedelta
+from typing import AsyncIterator
+
+import sqlalchemy as sa
+from fastapi.logger import logger
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import config
+from src.database import engine
+from src.models.base import association_table
+from src.models.entries import Entry
+
+
+PARTITIONS_LOCK = 4243
+DEFAULT_PARTITION = 'entry_default'
+ARCHIVE_PARTITION = 'entry_archive'
+ENTRY_FKEY = 'association_table_entry_fkey'
+MONTHLY_PARTITION = re.compile(r'^entry_y(\d{4})m(\d{2})$')
+UPPER_BOUND = re.compile(r"TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+columns = ', '.join(column.name for column in Entry.__table__.c)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return month_start(month_start(day) + timedelta(days=32))
+
+
+def add_months(day: date, months: int) -> date:
+    year, month = divmod(day.year * 12 + day.month - 1 + months, 12)
+    return date(year, month + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'entry_y{month:%Y}m{month:%m}'
+
+
+async def partitions(conn: AsyncConnection) -> dict[str, str]:
+    rows = await conn.execute(
+        sa.text(
+            'SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i '
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = 'entry'::regclass"
+        )
+    )
+    return {name: bound for name, bound in rows.tuples()}
+
+
+def monthly(names: dict[str, str]) -> dict[date, str]:
+    months = {}
+    for name in names:
+        match = MONTHLY_PARTITION.match(name)
+        if match:
+            months[date(int(match[1]), int(match[2]), 1)] = name
+    return months
+
+
+def archive_bound(names: dict[str, str]) -> date | None:
+    match = UPPER_BOUND.search(names.get(ARCHIVE_PARTITION, ''))
+    return date.fromisoformat(match[1]) if match else None
+
+
+@contextlib.asynccontextmanager
+async def detached_references(conn: AsyncConnection) -> AsyncIterator[None]:
+    fkey = next(c for c in association_table.constraints if c.name == ENTRY_FKEY)
+    await conn.execute(sa.schema.DropConstraint(fkey))  # type: ignore[no-untyped-call]
+    yield
+    await conn.execute(sa.schema.AddConstraint(fkey))  # type: ignore[no-untyped-call]
+
+
+async def attach(conn: AsyncConnection, name: str, start: str, end: str) -> None:
+    await conn.execute(sa.text(f'ALTER TABLE entry ATTACH PARTITION {name} FOR VALUES FROM ({start}) TO ({end})'))
+
+
+async def create_partitions(conn: AsyncConnection, since: date, until: date) -> list[str]:
+    names = await partitions(conn)
+    existing, archived = monthly(names), archive_bound(names)
+    stray = await conn.scalars(
+        sa.text(f"SELECT DISTINCT CAST(date_trunc('month', date) AS DATE) FROM {DEFAULT_PARTITION}")
+    )
+    months = set(stray.all())
+    month = month_start(since)
+    while month <= until:
+        months.add(month)
+        month = next_month(month)
+    created = []
+    for month in sorted(months):
+        name, end = partition_name(month), next_month(month)
+        if month in existing or (archived is not None and month < archived):
+            continue
+        moved = await conn.scalar(
+            sa.text(f'SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date >= :start AND date < :end)'),
+            {'start': month, 'end': end},
+        )
+        if not moved:
+            await conn.execute(
+                sa.text(f"CREATE TABLE {name} PARTITION OF entry FOR VALUES FROM ('{month}') TO ('{end}')")
+            )
+        else:
+            async with detached_references(conn):
+                await conn.execute(sa.text(f'CREATE TABLE {name} (LIKE entry INCLUDING DEFAULTS)'))
+                await conn.execute(
+                    sa.text(
+                        f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date >= :start AND date < :end '
+                        f'RETURNING {columns}) INSERT INTO {name} ({columns}) SELECT {columns} FROM moved'
+                    ),
+                    {'start': month, 'end': end},
+                )
+                await attach(conn, name, f"'{month}'", f"'{end}'")
+        created.append(name)
+    return created
+
+
+async def archive(conn: AsyncConnection, cutoff: date) -> list[str]:
+    names = await partitions(conn)
+    archived, bound = [], archive_bound(names)
+    for month, name in sorted(monthly(names).items()):
+        if next_month(month) > cutoff:
+            break
+        if await conn.scalar(sa.text(f'SELECT EXISTS (SELECT 1 FROM {name} WHERE NOT completed)')):
+            break
+        archived.append(name)
+        bound = next_month(month)
+    if not archived:
+        return []
+    async with detached_references(conn):
+        if ARCHIVE_PARTITION in names:
+            await conn.execute(sa.text(f'ALTER TABLE entry DETACH PARTITION {ARCHIVE_PARTITION}'))
+        else:
+            await conn.execute(sa.text(f'CREATE TABLE {ARCHIVE_PARTITION} (LIKE entry INCLUDING DEFAULTS)'))
+        for name in archived:
+            await conn.execute(sa.text(f'ALTER TABLE entry DETACH PARTITION {name}'))
+            await conn.execute(sa.text(f'INSERT INTO {ARCHIVE_PARTITION} ({columns}) SELECT {columns} FROM {name}'))
+            await conn.execute(sa.text(f'DROP TABLE {name}'))
+        await attach(conn, ARCHIVE_PARTITION, 'MINVALUE', f"'{bound}'")
+    return archived
+
+
+async def maintain(
+    ahead: int = config.ENTRY_PARTITIONS_AHEAD, archive_after: int = config.ENTRY_ARCHIVE_AFTER_MONTHS
+) -> tuple[list[str], list[str]]:
+    today = month_start(date.today())
+    async with engine.begin() as conn:
+        await conn.execute(sa.select(sa.func.pg_advisory_xact_lock(PARTITIONS_LOCK)))
+        created = await create_partitions(conn, today, add_months(today, ahead))
+        archived = await archive(conn, add_months(today, -archive_after))
+    logger.info(f'[partitions]: created {created}, archived {archived}')
+    return created, archived
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Create upcoming entry partitions and archive completed months')
+    parser.add_argument('--ahead', type=int, default=config.ENTRY_PARTITIONS_AHEAD)
+    parser.add_argument('--archive-after', type=int, default=config.ENTRY_ARCHIVE_AFTER_MONTHS)
+    args = parser.parse_args()
+    created, archived = await maintain(args.ahead, args.archive_after)
+    print(f'created: {", ".join(created) or "-"}')
+    print(f'archived: {", ".join(archived) or "-"}')
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,16 +1,17 @@
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Generic, Type, TypeVar, cast
 
 import sqlalchemy as sa
 from fastapi import Depends, HTTPException, status
 from fastapi_filter.contrib.sqlalchemy import Filter
-from fastapi_pagination.ext.sqlalchemy import paginate
-from fastapi_pagination.links import Page
 from pydantic import UUID4, BaseModel
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import QueryableAttribute, WriteOnlyCollection
+from sqlalchemy.orm import WriteOnlyCollection
 
 from src.database import get_async_session
 from src.models.base import BaseDBModel
+from src.pagination import Page, paginate
 
 
 BaseModelType = TypeVar('BaseModelType', bound=BaseDBModel)
@@ -21,6 +22,9 @@ BaseSchemaUpdatePartial = TypeVar('BaseSchemaUpdatePartial', bound=BaseModel)
 BaseSchemaAdminUpdate = TypeVar('BaseSchemaAdminUpdate', bound=BaseModel)
 BaseSchemaAdminUpdatePartial = TypeVar('BaseSchemaAdminUpdatePartial', bound=BaseModel)
 BaseFilterType = TypeVar('BaseFilterType', bound=Filter)
+DMLType = TypeVar('DMLType', sa.Update, sa.Delete)
+
+statements: dict[tuple[Type[BaseDBModel], tuple[str, ...]], sa.Select[Any]] = {}
 
 
 class BaseRepository(
@@ -45,21 +49,28 @@ class BaseRepository(
     async def find_all(self, model_filter: BaseFilterType) -> Page[BaseSchemaType]:
         query = sa.select(self.model)
         query = model_filter.filter(query)
-        query = model_filter.sort(query)
         return await paginate(
             self.session,
             query,
+            model_filter.ordering_values,
             transformer=lambda items: [self.schema.model_validate(item) for item in items],
         )
 
+    @classmethod
+    def select_by(cls, *fields: str) -> sa.Select[tuple[BaseModelType]]:
+        key = (cls.model, fields)
+        if key not in statements:
+            statements[key] = sa.select(cls.model).filter_by(**{field: sa.bindparam(field) for field in fields})
+        return statements[key]
+
     async def find_by_uuid(self, uuid: UUID4 | str, detail: str = 'Not found') -> BaseModelType:
-        result = await self.session.scalar(sa.select(self.model).filter_by(uuid=uuid))
+        result = await self.session.scalar(self.select_by('uuid'), {'uuid': uuid})
         if result is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
         return result
 
     async def find_one(self, detail: str = 'Not found', **filter_by: Any) -> BaseModelType:
-        result = await self.session.scalar(sa.select(self.model).filter_by(**filter_by))
+        result = await self.session.scalar(self.select_by(*sorted(filter_by)), filter_by)
         if result is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
         return result
@@ -77,8 +88,7 @@ class BaseRepository(
     async def create(self, values: BaseSchemaCreate) -> BaseModelType:
         new_instance = self.model(**values.model_dump())
         self.session.add(new_instance)
-        await self.session.commit()
-        await self.session.refresh(new_instance)
+        await self.commit()
         return new_instance
 
     async def update(
@@ -96,18 +106,46 @@ class BaseRepository(
                 exclude_defaults=exclude_defaults,
             )
         )
-        await self.session.commit()
-        await self.session.refresh(instance)
+        await self.commit()
         return instance
 
     async def delete(self, instance: BaseModelType) -> None:
         await self.session.delete(instance)
         await self.session.commit()
 
-    async def unique(self, field: str, value: Any) -> bool:
-        attr: QueryableAttribute[Any] = getattr(self.model, field)
-        result = await self.session.scalar(sa.select(self.model).filter(attr.ilike(value)))
-        return result is None
+    def bulk_statement(self, statement: DMLType, model_filter: BaseFilterType) -> DMLType:
+        if not list(model_filter.filtering_fields):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Provide uuids or a filter')
+        return cast(DMLType, model_filter.filter(statement))  # type: ignore[arg-type]
+
+    async def bulk_update(self, model_filter: BaseFilterType, values: dict[str, Any]) -> int:
+        if not values:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Nothing to update')
+        statement = self.bulk_statement(sa.update(self.model).values(**values), model_filter)
+        result = await self.session.execute(statement, execution_options={'synchronize_session': False})
+        await self.commit()
+        return cast(CursorResult[Any], result).rowcount
+
+    async def bulk_delete(self, model_filter: BaseFilterType) -> int:
+        statement = self.bulk_statement(sa.delete(self.model), model_filter)
+        result = await self.session.execute(statement, execution_options={'synchronize_session': False})
+        await self.session.commit()
+        return cast(CursorResult[Any], result).rowcount
+
+    async def commit(self) -> None:
+        try:
+            await self.session.commit()
+        except IntegrityError as exc:
+            await self.session.rollback()
+            constraint = getattr(exc.orig.__cause__, 'constraint_name', None) if exc.orig else None
+            table = self.model.__tablename__
+            for column in self.model.__table__.columns:
+                if constraint in (f'{table}_{column.name}_key', f'ix_{table}_{column.name}_lower'):
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail=f'Please choose a different {column.name}',
+                    ) from exc
+            raise
 
     async def verify_uniqueness(
         self,
@@ -119,12 +157,19 @@ class BaseRepository(
         fields: list[str],
         instance: BaseModelType | None = None,
     ) -> None:
-        errors = []
+        taken = {}
         for field_name in fields:
             field_value = getattr(values, field_name, None)
             if field_value and (field_value != getattr(instance, field_name) if instance else True):
-                if not await self.unique(field_name, field_value):
-                    errors.append(f'Please choose a different {field_name}')
+                taken[field_name] = sa.func.lower(getattr(self.model, field_name)) == str(field_value).lower()
+        if not taken:
+            return
+        query = sa.select(*(sa.func.bool_or(clause).label(name) for name, clause in taken.items()))
+        query = query.filter(sa.or_(*taken.values()))
+        if instance is not None:
+            query = query.filter(self.model.uuid != instance.uuid)
+        result = (await self.session.execute(query)).one()
+        errors = [f'Please choose a different {name}' for name in taken if getattr(result, name)]
         if errors:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
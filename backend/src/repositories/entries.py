@@ -2,11 +2,12 @@ from typing import Any, TypeAlias
 
 import sqlalchemy as sa
 from fastapi import HTTPException, status
-from fastapi_pagination.ext.sqlalchemy import paginate
-from fastapi_pagination.links import Page
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as pg_UUID
 
 from src.models.entries import Entry
 from src.models.services import Service
+from src.pagination import Page, paginate
 from src.repositories.base import BaseRepository
 from src.schemas.entries import (
     EntryAdminUpdate,
@@ -23,6 +24,27 @@ from src.utils import get_url
 
 EntrySchema: TypeAlias = EntryUpdate | EntryUpdatePartial | EntryAdminUpdate | EntryAdminUpdatePartial
 
+neighbours = sa.union_all(
+    sa.select(Entry.uuid)
+    .filter(
+        Entry.date == sa.bindparam('date'),
+        Entry.time <= sa.bindparam('time'),
+        Entry.uuid.is_distinct_from(sa.bindparam('uuid')),
+    )
+    .order_by(Entry.time.desc())
+    .limit(1),
+    sa.select(Entry.uuid)
+    .filter(Entry.date == sa.bindparam('date'), Entry.time > sa.bindparam('time'))
+    .order_by(Entry.time)
+    .limit(1),
+).subquery()
+neighbours_query = sa.select(Entry).filter(
+    Entry.date == sa.bindparam('date'), Entry.uuid.in_(sa.select(neighbours.c.uuid))
+)
+services_query = sa.select(Service).filter(
+    Service.uuid == sa.any_(sa.bindparam('uuids', type_=ARRAY(pg_UUID(as_uuid=True))))
+)
+
 
 class EntryRepository(
     BaseRepository[
@@ -41,26 +63,18 @@ class EntryRepository(
     filter_type = EntryFilter
 
     async def can_create_entry(self, instance: Entry, context: str = 'create') -> bool:
-        filters = [Entry.date == instance.date, Entry.time <= instance.time]
-        if context == 'update':
-            filters.append(Entry.uuid != instance.uuid)
-        prev_entry = await self.session.scalar(
-            sa.select(Entry).filter(sa.and_(*filters)).order_by(Entry.date.desc(), Entry.time.desc())
-        )
-        if prev_entry and prev_entry.ending_time > instance.timestamp:
-            return False
-        next_entry = await self.session.scalar(
-            sa.select(Entry)
-            .filter(sa.and_(Entry.date == instance.date, Entry.time > instance.time))
-            .order_by(Entry.date, Entry.time)
-        )
-        if next_entry and next_entry.timestamp < instance.ending_time:
-            return False
+        uuid = instance.uuid if context == 'update' else None
+        params = {'date': instance.date, 'time': instance.time, 'uuid': uuid}
+        for entry in await self.session.scalars(neighbours_query, params):
+            if entry.time <= instance.time and entry.ending_time > instance.timestamp:
+                return False
+            if entry.time > instance.time and entry.timestamp < instance.ending_time:
+                return False
         return True
 
     async def create(self, values: EntryCreate, **kwargs: Any) -> Entry:
         new_instance = self.model(**values.model_dump(exclude={'services'}), **kwargs)
-        services = await self.session.scalars(sa.select(Service).filter(Service.uuid.in_(values.services)))
+        services = await self.session.scalars(services_query, {'uuids': values.services})
         new_instance.services.extend(services)
         if not await self.can_create_entry(new_instance):
             url = get_url('entries', 'get_by_date', date=values.date.strftime('%Y-%m-%d'))
@@ -70,7 +84,6 @@ class EntryRepository(
             )
         self.session.add(new_instance)
         await self.session.commit()
-        await self.session.refresh(new_instance)
         return new_instance
 
     async def update(
@@ -90,7 +103,7 @@ class EntryRepository(
             )
         )
         if values.services is not None:
-            services = await self.session.scalars(sa.select(Service).filter(Service.uuid.in_(values.services)))
+            services = await self.session.scalars(services_query, {'uuids': values.services})
             entry.services.clear()
             entry.services.extend(services)
         if not await self.can_create_entry(entry, context='update'):
@@ -100,7 +113,6 @@ class EntryRepository(
                 detail=f'Please choose different date or time. See all entries for this date: {url}',
             )
         await self.session.commit()
-        await self.session.refresh(entry)
         return entry
 
     async def find_all_public(self, **filter_by: Any) -> Page[EntryInfo]:
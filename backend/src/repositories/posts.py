@@ -1,9 +1,14 @@
 from pathlib import Path
 from typing import TypeAlias
 
+import sqlalchemy as sa
+import sqlalchemy.orm as so
 from fastapi import UploadFile
+from fastapi.background import BackgroundTasks
 
-from src.models.posts import Post
+from src.core.config import config
+from src.models.posts import SEARCH_CONFIG, Post, search_query
+from src.pagination import Page, paginate_ordered
 from src.repositories.base import BaseRepository
 from src.schemas.posts import (
     PostAdminUpdate,
@@ -11,6 +16,7 @@ from src.schemas.posts import (
     PostCreate,
     PostFilter,
     PostRead,
+    PostSearchRead,
     PostUpdate,
     PostUpdatePartial,
 )
@@ -19,6 +25,8 @@ from src.utils import ImageType, delete_image, get_image, save_image
 
 PostUpdateSchema: TypeAlias = PostUpdate | PostUpdatePartial | PostAdminUpdate | PostAdminUpdatePartial
 
+HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
+
 
 class PostRepository(
     BaseRepository[
@@ -71,3 +79,43 @@ class PostRepository(
         old_post_image = post.image
         await super().delete(post)
         delete_image(old_post_image, path=ImageType.POSTS)
+
+    async def bulk_delete(self, model_filter: PostFilter, background_tasks: BackgroundTasks | None = None) -> int:
+        statement = self.bulk_statement(sa.delete(Post), model_filter).returning(Post.image)
+        images = (await self.session.scalars(statement, execution_options={'synchronize_session': False})).all()
+        await self.session.commit()
+        for image in images:
+            if background_tasks is None:
+                delete_image(image, path=ImageType.POSTS)
+            else:
+                background_tasks.add_task(delete_image, image, path=ImageType.POSTS)
+        return len(images)
+
+    async def search(self, text: str) -> Page[PostSearchRead]:
+        if len(text) < config.SEARCH_MIN_LENGTH:
+            query = (
+                sa.select(Post)
+                .filter(
+                    sa.or_(Post.title.icontains(text, autoescape=True), Post.content.icontains(text, autoescape=True))
+                )
+                .order_by(Post.created.desc(), Post.uuid)
+            )
+        else:
+            tsquery = search_query(text)
+            rank = sa.func.ts_rank_cd(Post.search_vector, tsquery)
+            query = (
+                sa.select(Post)
+                .options(
+                    so.with_expression(Post.rank, rank),
+                    so.with_expression(
+                        Post.snippet, sa.func.ts_headline(SEARCH_CONFIG, Post.content, tsquery, HEADLINE_OPTIONS)
+                    ),
+                )
+                .filter(Post.search_vector.bool_op('@@')(tsquery))
+                .order_by(rank.desc(), Post.uuid)
+            )
+        return await paginate_ordered(
+            self.session,
+            query,
+            transformer=lambda items: [PostSearchRead.model_validate(item) for item in items],
+        )
@@ -1,30 +1,199 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import time
-from typing import Any, Awaitable, Callable
+from functools import partial
+from typing import Any, Awaitable, Callable, TypeVar, cast
 
+import httpx
 import redis.asyncio as aioredis
 from cryptography.fernet import Fernet
 from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.logger import logger
 from fastapi.responses import JSONResponse
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.key_builder import default_key_builder
+from fastapi_mail.email_utils import DefaultChecker
 from pydantic import UUID4
+from redis.asyncio.cluster import ClusterNode, RedisCluster
+from redis.asyncio.retry import Retry
+from redis.asyncio.sentinel import Sentinel
+from redis.backoff import ExponentialBackoff
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.core.config import config
+from src.metrics import metrics
+from src.utils import CircuitState
 
 
-def create_redis() -> aioredis.ConnectionPool:
-    return aioredis.ConnectionPool.from_url(config.REDIS_DSN, decode_responses=False)
+T = TypeVar('T')
 
+circuit_state = metrics.gauge('redis_circuit_state', 'Circuit breaker state (0 closed, 1 open, 2 half-open)')
+circuit_transitions = metrics.counter('redis_circuit_transitions_total', 'Circuit breaker state changes')
+redis_failures = metrics.counter('redis_failures_total', 'Failed or timed out Redis operations')
+redis_rejections = metrics.counter('redis_rejections_total', 'Redis operations skipped by an open circuit')
 
-pool = create_redis()
 
+def parse_nodes(nodes: list[str]) -> list[tuple[str, int]]:
+    return [(host, int(port)) for host, _, port in (node.rpartition(':') for node in nodes)]
 
-def get_redis() -> aioredis.Redis[Any]:
+
+def create_redis() -> aioredis.Redis[Any]:
+    options: dict[str, Any] = {
+        'password': config.REDIS_PASSWORD or None,
+        'decode_responses': False,
+        'socket_timeout': config.REDIS_SOCKET_TIMEOUT,
+        'socket_connect_timeout': config.REDIS_CONNECT_TIMEOUT,
+        'socket_keepalive': config.REDIS_KEEPALIVE,
+        'health_check_interval': config.REDIS_HEALTH_CHECK_INTERVAL,
+        'retry': Retry(
+            ExponentialBackoff(cap=config.REDIS_BACKOFF_CAP, base=config.REDIS_BACKOFF_BASE), config.REDIS_RETRIES
+        ),
+        'retry_on_error': [aioredis.ConnectionError, aioredis.TimeoutError],
+    }
+    if config.REDIS_MODE == 'sentinel':
+        sentinel = Sentinel(parse_nodes(config.REDIS_SENTINELS), db=config.REDIS_DB, **options)
+        return sentinel.master_for(config.REDIS_SENTINEL_MASTER, max_connections=config.REDIS_MAX_CONNECTIONS)
+    if config.REDIS_MODE == 'cluster':
+        cluster: RedisCluster[Any] = RedisCluster(
+            startup_nodes=[ClusterNode(host, port) for host, port in parse_nodes(config.REDIS_CLUSTER_NODES)],
+            max_connections=config.REDIS_MAX_CONNECTIONS,
+            **options,
+        )
+        return cast('aioredis.Redis[Any]', cluster)
+    options.pop('password')
+    pool: aioredis.ConnectionPool = aioredis.ConnectionPool.from_url(
+        config.REDIS_DSN, max_connections=config.REDIS_MAX_CONNECTIONS, **options
+    )
     return aioredis.Redis(connection_pool=pool)
 
 
+client = create_redis()
+
+
+def get_redis() -> aioredis.Redis[Any]:
+    return client
+
+
+async def close_redis() -> None:
+    if isinstance(client, RedisCluster):
+        await client.aclose()
+    else:
+        await client.connection_pool.disconnect()
+
+
+class RedisGuard:
+    def __init__(
+        self,
+        feature: str,
+        *,
+        timeout: float,
+        fail_open: bool,
+        failure_threshold: int = config.REDIS_BREAKER_THRESHOLD,
+        recovery_time: float = config.REDIS_BREAKER_RECOVERY,
+    ) -> None:
+        self.feature = feature
+        self.timeout = timeout
+        self.fail_open = fail_open
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        circuit_state.set(0, feature=feature)
+
+    def set_state(self, state: CircuitState) -> None:
+        if state is self.state:
+            return
+        logger.warning(f'[redis]: {self.feature} circuit {self.state.value} -> {state.value}')
+        self.state = state
+        circuit_state.set(list(CircuitState).index(state), feature=self.feature)
+        circuit_transitions.inc(feature=self.feature, state=state.value)
+
+    def allow(self) -> bool:
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN and time.monotonic() - self.opened_at >= self.recovery_time:
+            self.set_state(CircuitState.HALF_OPEN)
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.set_state(CircuitState.CLOSED)
+
+    def record_failure(self, exc: BaseException) -> None:
+        logger.warning(f'[redis]: {self.feature} operation failed: {exc!r}')
+        redis_failures.inc(feature=self.feature)
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.set_state(CircuitState.OPEN)
+
+    def fallback(self, default: T) -> T:
+        if self.fail_open:
+            return default
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Service temporarily unavailable',
+        )
+
+    async def run(self, operation: Callable[[], Awaitable[T]], default: T) -> T:
+        if not self.allow():
+            redis_rejections.inc(feature=self.feature)
+            return self.fallback(default)
+        try:
+            result = await asyncio.wait_for(operation(), self.timeout)
+        except (aioredis.RedisError, OSError, asyncio.TimeoutError) as e:
+            self.record_failure(e)
+            return self.fallback(default)
+        except BaseException:
+            if self.state is CircuitState.HALF_OPEN:
+                self.opened_at = time.monotonic()
+                self.set_state(CircuitState.OPEN)
+            raise
+        self.record_success()
+        return result
+
+
+rate_limit_guard = RedisGuard(
+    'rate_limit',
+    timeout=config.REDIS_RATE_LIMIT_TIMEOUT,
+    fail_open=config.REDIS_RATE_LIMIT_FAIL_OPEN,
+)
+cache_guard = RedisGuard('cache', timeout=config.REDIS_CACHE_TIMEOUT, fail_open=config.REDIS_CACHE_FAIL_OPEN)
+tokens_guard = RedisGuard('tokens', timeout=config.REDIS_TOKENS_TIMEOUT, fail_open=config.REDIS_TOKENS_FAIL_OPEN)
+email_guard = RedisGuard('email', timeout=config.REDIS_EMAIL_TIMEOUT, fail_open=config.REDIS_EMAIL_FAIL_OPEN)
+
+
+class GuardedRedisBackend(RedisBackend):
+    async def get_with_ttl(self, key: str) -> tuple[int, str]:
+        return await cache_guard.run(partial(super().get_with_ttl, key), (0, None))  # type: ignore[arg-type]
+
+    async def get(self, key: str) -> str | None:
+        return await cache_guard.run(partial(super().get, key), None)
+
+    async def set(self, key: str, value: str, expire: int | None = None) -> None:
+        await cache_guard.run(partial(super().set, key, value, expire), None)
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        return await cache_guard.run(partial(super().clear, namespace, key), 0)
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = '',
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+) -> str:
+    query = request.url.query if request else ''
+    return default_key_builder(func, namespace, request, response, args, {**(kwargs or {}), 'query': query})
+
+
 class RedisRepository:
     def __init__(self, redis: aioredis.Redis[Any] = Depends(get_redis)) -> None:
         self.redis = redis
@@ -39,39 +208,266 @@ class RedisRepository:
 
     async def send_token(self, token: str, uuid: UUID4 | str) -> None:
         encrypted_token = self.encrypt_token(token)
-        await self.redis.hset(self.redis_hash, str(uuid), encrypted_token)
+        await tokens_guard.run(partial(self.redis.hset, self.redis_hash, str(uuid), encrypted_token), None)
 
     async def get_token(self, uuid: UUID4 | str) -> str | None:
-        token = await self.redis.hget(self.redis_hash, str(uuid))
+        token = await tokens_guard.run(partial(self.redis.hget, self.redis_hash, str(uuid)), None)
         return self.decrypt_token(token) if token else None
 
     async def delete_token(self, uuid: UUID4 | str) -> None:
-        await self.redis.hdel(self.redis_hash, str(uuid))
+        await tokens_guard.run(partial(self.redis.hdel, self.redis_hash, str(uuid)), None)
+
+
+class DisposableDomains:
+    def __init__(self, refresh_interval: float) -> None:
+        self.redis = get_redis()
+        self.refresh_interval = refresh_interval
+        self.source: frozenset[str] = frozenset()
+        self.domains: frozenset[str] = frozenset()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    def __contains__(self, email: str) -> bool:
+        return email.rpartition('@')[2].lower() in self.domains
+
+    @staticmethod
+    def normalize(domains: list[Any]) -> frozenset[str]:
+        return frozenset(
+            domain.strip().lower()
+            for domain in (d.decode() if isinstance(d, bytes) else d for d in domains)
+            if domain.strip()
+        )
+
+    async def load(self) -> None:
+        try:
+            self.source = self.normalize(await DefaultChecker(db_provider='redis').fetch_temp_email_domains())
+        except httpx.HTTPError as e:
+            logger.warning(f'[disposable domains]: failed to fetch the domain list: {e}')
+        if self.source and not await email_guard.run(partial(self.redis.exists, 'temp_domains'), 1):
+            await email_guard.run(partial(self.redis.hset, 'temp_domains', mapping=dict.fromkeys(self.source, 1)), None)
+        await self.refresh()
+
+    async def refresh(self) -> None:
+        async def operation() -> list[Any]:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hkeys('temp_domains')
+                pipe.hkeys('blocked_domains')
+                return await pipe.execute()
+
+        results = await email_guard.run(operation, None)
+        if results is not None:
+            self.domains = self.source | self.normalize(results[0] + results[1])
+        elif not self.domains:
+            self.domains = self.source
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self.refresh_interval)
+            await self.refresh()
+
+    async def start(self) -> None:
+        await self.load()
+        if self._task is None and self.refresh_interval > 0:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+
+class PrimaryPins:
+    def __init__(self, seconds: int) -> None:
+        self.redis = get_redis()
+        self.seconds = seconds
+
+    async def pin(self, identity: str) -> None:
+        await cache_guard.run(partial(self.redis.set, f'primary_pin:{identity}', 1, ex=self.seconds), None)
+
+    async def is_pinned(self, identity: str) -> bool:
+        return bool(await cache_guard.run(partial(self.redis.exists, f'primary_pin:{identity}'), 1))
+
+
+class CountCache:
+    def __init__(self, expire: int) -> None:
+        self.redis = get_redis()
+        self.expire = expire
+
+    async def get(self, key: str) -> int | None:
+        total = await cache_guard.run(partial(self.redis.get, f'count:{key}'), None)
+        return None if total is None else int(total)
+
+    async def set(self, key: str, total: int) -> None:
+        await cache_guard.run(partial(self.redis.set, f'count:{key}', total, ex=self.expire), None)
 
 
 class RateLimiter:
     def __init__(self) -> None:
         self.redis = get_redis()
+        self.transaction = not isinstance(self.redis, RedisCluster)
 
     async def is_rate_limited(self, key: str, max_requests: int, window: int) -> bool:
         current = int(time.time())
         window_start = current - window
-        async with self.redis.pipeline() as pipe:
-            try:
+
+        async def operation() -> list[Any]:
+            async with self.redis.pipeline(transaction=self.transaction) as pipe:
                 pipe.zremrangebyscore(key, 0, window_start)
                 pipe.zcard(key)
                 pipe.zadd(key, {str(current): current})
                 pipe.expire(key, window)
-                results = await pipe.execute()
-            except aioredis.RedisError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f'Redis error: {e!r}',
-                ) from e
-        return results[1] > max_requests
+                return await pipe.execute()
+
+        results = await rate_limit_guard.run(operation, None)
+        return results is not None and results[1] > max_requests
+
+    async def hit(self, key: str, window: int, amount: int = 1) -> int | None:
+        async def operation() -> list[Any]:
+            async with self.redis.pipeline(transaction=self.transaction) as pipe:
+                pipe.incrby(key, amount)
+                pipe.expire(key, window)
+                return await pipe.execute()
+
+        results = await rate_limit_guard.run(operation, None)
+        return results[0] if results is not None else None
 
+    async def count(self, key: str) -> int:
+        count = await rate_limit_guard.run(partial(self.redis.get, key), None)
+        return int(count) if count is not None else 0
 
+    async def hit_many(self, hits: dict[str, int], window: int) -> list[int] | None:
+        async def operation() -> list[Any]:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, amount in hits.items():
+                    pipe.incrby(key, amount)
+                    pipe.expire(key, window)
+                return await pipe.execute()
+
+        results = await rate_limit_guard.run(operation, None)
+        return results[::2] if results is not None else None
+
+
+class TokenBucket:
+    __slots__ = ('window_key', 'window_id', 'max_requests', 'window', 'synced', 'pending', 'tokens')
+
+    def __init__(self, key: str, max_requests: int, window: int, window_id: int) -> None:
+        self.window_key = f'{key}:{window_id}'
+        self.window_id = window_id
+        self.max_requests = max_requests
+        self.window = window
+        self.synced = 0
+        self.pending = 0
+        self.tokens = 0
+
+    def consume(self, cost: int) -> bool:
+        if self.tokens < cost:
+            return False
+        self.tokens -= cost
+        self.pending += cost
+        return True
+
+    def refill(self, count: int, error_bound: float) -> None:
+        self.synced = count
+        self.tokens = int(max(self.max_requests - count - self.pending, 0) * error_bound)
+
+
+class LocalRateLimiter:
+    def __init__(self, backend: RateLimiter, sync_interval: float, error_bound: float) -> None:
+        self.backend = backend
+        self.sync_interval = sync_interval
+        self.error_bound = error_bound
+        self.buckets: dict[str, TokenBucket] = {}
+        self.retired: list[TokenBucket] = []
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    def get_bucket(self, key: str, max_requests: int, window: int) -> TokenBucket:
+        window_id = int(time.time()) // window
+        bucket = self.buckets.get(key)
+        if bucket is None or bucket.window_id != window_id:
+            if bucket is not None and bucket.pending:
+                self.retired.append(bucket)
+            bucket = self.buckets[key] = TokenBucket(key, max_requests, window, window_id)
+        return bucket
+
+    async def is_rate_limited(self, key: str, max_requests: int, window: int, cost: int = 1) -> bool:
+        bucket = self.get_bucket(key, max_requests, window)
+        if bucket.consume(cost):
+            return False
+        pending, bucket.pending = bucket.pending, 0
+        count = None
+        try:
+            count = await self.backend.hit(bucket.window_key, window, pending + cost)
+        finally:
+            if count is None:
+                bucket.pending += pending
+        if count is None:
+            return False
+        bucket.refill(count, self.error_bound)
+        return count > max_requests
+
+    async def sync(self) -> None:
+        now = int(time.time())
+        buckets, self.retired = self.retired, []
+        for key, bucket in list(self.buckets.items()):
+            if bucket.window_id < now // bucket.window:
+                del self.buckets[key]
+                if not bucket.pending:
+                    continue
+            buckets.append(bucket)
+        batches: dict[int, list[tuple[TokenBucket, int]]] = {}
+        for bucket in buckets:
+            batches.setdefault(bucket.window, []).append((bucket, bucket.pending))
+            bucket.pending = 0
+        for window, batch in batches.items():
+            counts = await self.backend.hit_many({bucket.window_key: hits for bucket, hits in batch}, window)
+            if counts is None:
+                for bucket, hits in batch:
+                    bucket.pending += hits
+                self.retired.extend(bucket for bucket, _ in batch if bucket.window_id < now // window)
+                continue
+            for (bucket, _), count in zip(batch, counts):
+                bucket.refill(count, self.error_bound)
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self.sync_interval)
+            await self.sync()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            await self.sync()
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+
+disposable_domains = DisposableDomains(config.DISPOSABLE_DOMAINS_REFRESH_INTERVAL)
+primary_pins = PrimaryPins(config.POSTGRES_PRIMARY_PIN_SECONDS)
+count_cache = CountCache(config.COUNT_CACHE_EXPIRE)
 rate_limiter = RateLimiter()
+local_rate_limiter = LocalRateLimiter(
+    rate_limiter,
+    sync_interval=config.RATE_LIMIT_SYNC_INTERVAL / 1000,
+    error_bound=config.RATE_LIMIT_ERROR_BOUND / config.RATE_LIMIT_WORKERS,
+)
+
+
+async def is_rate_limited(key: str, max_requests: int, window: int, cost: int = 1) -> bool:
+    if config.RATE_LIMIT_LOCAL:
+        return await local_rate_limiter.is_rate_limited(key, max_requests, window, cost)
+    count = await rate_limiter.hit(f'{key}:{int(time.time()) // window}', window, cost)
+    return count is not None and count > max_requests
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -80,7 +476,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app: FastAPI,
     ) -> None:
         super().__init__(app)
-        self.rate_limiter = rate_limiter
+        self.rate_limiter: RateLimiter | LocalRateLimiter = (
+            local_rate_limiter if config.RATE_LIMIT_LOCAL else rate_limiter
+        )
         self.max_requests = config.MAX_REQUESTS
         self.window = config.MAX_REQUESTS_WINDOW
 
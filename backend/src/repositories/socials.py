@@ -41,7 +41,6 @@ class SocialRepository(
         socials.avatar = await save_image(file, path=ImageType.PROFILES)
         self.session.add(socials)
         await self.session.commit()
-        await self.session.refresh(socials)
         delete_image(old_avatar, path=ImageType.PROFILES)
 
     async def delete_avatar(self, socials: SocialMedia) -> None:
@@ -49,4 +48,3 @@ class SocialRepository(
         socials.avatar = config.DEFAULT_AVATAR
         self.session.add(socials)
         await self.session.commit()
-        await self.session.refresh(socials)
@@ -0,0 +1,138 @@
+import asyncio
+import contextlib
+from datetime import date, timedelta
+from typing import Any
+
+import sqlalchemy as sa
+from fastapi import Depends
+from fastapi.logger import logger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.config import config
+from src.database import engine, get_async_session
+from src.metrics import metrics
+from src.models.services import Service
+from src.models.stats import (
+    STATS_VIEWS,
+    MaterializedView,
+    stats_daily_entries,
+    stats_daily_services,
+    stats_refreshed,
+    stats_weekly_posts,
+    stats_weekly_users,
+)
+from src.schemas.stats import DailyEntries, ServiceMinutes, Stats, WeeklyCount
+
+
+STATS_LOCK = 4242
+SOURCE_TABLES = ('entry', 'association_table', 'service', 'user', 'post')
+
+stats_refreshes = metrics.counter('stats_refreshes_total', 'Materialized stats refreshes')
+
+
+def between(column: Any, start: date | None, end: date | None) -> list[sa.ColumnElement[bool]]:
+    clauses = []
+    if start is not None:
+        clauses.append(column >= start)
+    if end is not None:
+        clauses.append(column <= end)
+    return clauses
+
+
+class StatsRepository:
+    def __init__(self, session: AsyncSession = Depends(get_async_session)) -> None:
+        self.session = session
+
+    async def weekly(self, view: MaterializedView, start: date | None, end: date | None) -> list[WeeklyCount]:
+        start = start and start - timedelta(days=start.weekday())
+        query = sa.select(view.table).filter(*between(view.c.week, start, end)).order_by(view.c.week)
+        return [WeeklyCount.model_validate(row) for row in (await self.session.execute(query)).all()]
+
+    async def get_stats(self, start: date | None = None, end: date | None = None) -> Stats:
+        daily = stats_daily_entries.c
+        days = (
+            await self.session.execute(
+                sa.select(stats_daily_entries.table).filter(*between(daily.date, start, end)).order_by(daily.date)
+            )
+        ).all()
+        services = stats_daily_services.c
+        minutes = (
+            await self.session.execute(
+                sa.select(
+                    services.service_id,
+                    Service.name,
+                    sa.func.sum(services.entries).label('entries'),
+                    sa.func.sum(services.minutes).label('minutes'),
+                )
+                .join(Service, Service.uuid == services.service_id)
+                .filter(*between(services.date, start, end))
+                .group_by(services.service_id, Service.name)
+                .order_by(sa.desc('minutes'))
+            )
+        ).all()
+        entries, completed = sum(day.entries for day in days), sum(day.completed for day in days)
+        return Stats(
+            refreshed=await self.session.scalar(sa.select(stats_refreshed.c.refreshed)),
+            completion_rate=completed / entries if entries else None,
+            entries_per_day=[DailyEntries.model_validate(day) for day in days],
+            minutes_per_service=[ServiceMinutes.model_validate(row) for row in minutes],
+            users_per_week=await self.weekly(stats_weekly_users, start, end),
+            posts_per_week=await self.weekly(stats_weekly_posts, start, end),
+        )
+
+
+class StatsRefresher:
+    def __init__(self, refresh_interval: float, bind: AsyncEngine = engine) -> None:
+        self.refresh_interval = refresh_interval
+        self.bind = bind
+        self.changes: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def refresh(self, force: bool = False) -> bool:
+        async with self.bind.begin() as conn:
+            if not await conn.scalar(sa.select(sa.func.pg_try_advisory_xact_lock(STATS_LOCK))):
+                return False
+            changes = await conn.scalar(
+                sa.text(
+                    'SELECT coalesce(sum(n_tup_ins + n_tup_upd + n_tup_del), 0) FROM pg_stat_user_tables '
+                    'WHERE relname = ANY(:tables) '
+                    "OR relid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'entry'::regclass)"
+                ),
+                {'tables': list(SOURCE_TABLES)},
+            )
+            if changes == self.changes and not force:
+                return False
+            for view in STATS_VIEWS:
+                await conn.execute(view.refresh())
+        self.changes = changes
+        stats_refreshes.inc()
+        return True
+
+    async def run(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self.refresh_interval)
+            if self._stopping.is_set():
+                return
+            try:
+                await self.refresh()
+            except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+                logger.warning(f'[stats]: refresh failed: {e}')
+
+    def start(self) -> None:
+        if self._task is None and self.refresh_interval > 0:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping.set()
+            try:
+                await self._task
+            finally:
+                self._task = None
+
+
+stats_refresher = StatsRefresher(config.STATS_REFRESH_INTERVAL)
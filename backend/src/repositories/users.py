@@ -1,10 +1,12 @@
 from typing import TYPE_CHECKING, TypeAlias
 
+import sqlalchemy as sa
+
 from fastapi.background import BackgroundTasks
 from fastapi.logger import logger
 
 from src.models.users import User
-from src.repositories.base import BaseRepository
+from src.repositories.base import BaseRepository, DMLType
 from src.schemas.users import (
     UserAdminUpdate,
     UserAdminUpdatePartial,
@@ -39,6 +41,9 @@ class UserRepository(
     schema = UserRead
     filter_type = UserFilter
 
+    def bulk_statement(self, statement: DMLType, model_filter: UserFilter) -> DMLType:
+        return super().bulk_statement(statement, model_filter).filter(User.admin.is_(sa.false()))
+
     async def create(self, values: UserCreate) -> User:
         await self.verify_uniqueness(values, ['username', 'email'])
         return await super().create(values)
@@ -1,16 +1,33 @@
+import re
 import uuid  # noqa: F401
 from datetime import datetime
-from typing import Annotated, TypeAlias
+from typing import Annotated, Any, TypeAlias
 
+import sqlalchemy as sa
 from fastapi_filter.contrib.sqlalchemy import Filter
-from pydantic import UUID4, AfterValidator
+from pydantic import UUID4, AfterValidator, BaseModel
 
 
 UUIDstr: TypeAlias = UUID4 | Annotated[str, AfterValidator(lambda x: uuid.UUID(x, version=4))]
 
+UUID_PREFIX = re.compile(r'[0-9a-f]{1,32}')
+
+
+def contains(column: Any, term: str) -> sa.ColumnElement[bool]:
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return column.ilike(f'%{escaped}%')
+
+
+def uuid_prefix(column: Any, term: str) -> sa.ColumnElement[bool] | None:
+    digits = term.lower().replace('-', '')
+    if not UUID_PREFIX.fullmatch(digits):
+        return None
+    return column.between(uuid.UUID(digits.ljust(32, '0')), uuid.UUID(digits.ljust(32, 'f')))
+
 
 class BaseFilter(Filter):
     uuid: Annotated[UUID4, AfterValidator(lambda x: str(x))] | str | None = None
+    uuid__in: list[UUID4] | None = None
     created: datetime | None = None
     created__gt: datetime | None = None
     created__gte: datetime | None = None
@@ -26,3 +43,30 @@ class BaseFilter(Filter):
 
     class Constants(Filter.Constants):
         pass
+
+    def filter(self, query: Any) -> Any:
+        if self.search is None or not hasattr(self.Constants, 'search_model_fields'):
+            return super().filter(query)
+        query = self.model_copy(update={'search': None}).filter(query)
+        return query.filter(sa.or_(*self.search_clauses(self.search)))
+
+    def search_clauses(self, term: str) -> list[sa.ColumnElement[bool]]:
+        clauses = []
+        for field_name in self.Constants.search_model_fields:
+            column = getattr(self.Constants.model, field_name)
+            if isinstance(column.type, sa.Uuid):
+                clause = uuid_prefix(column, term)
+            elif isinstance(column.type, sa.String):
+                clause = contains(column, term)
+            else:
+                try:
+                    clause = column == column.type.python_type(term)
+                except (TypeError, ValueError):
+                    clause = None
+            if clause is not None:
+                clauses.append(clause)
+        return clauses or [sa.false()]
+
+
+class BulkResult(BaseModel):
+    affected: int
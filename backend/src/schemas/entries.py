@@ -69,6 +69,10 @@ class EntryAdminUpdate(EntryUpdate):
     completed: bool
 
 
+class EntryBulkUpdate(BaseModel):
+    completed: bool | None = None
+
+
 class EntryInfo(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -3,11 +3,12 @@ from __future__ import annotations
 import uuid  # noqa: F401
 from datetime import datetime
 from functools import cached_property
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import UUID4, AfterValidator, BaseModel, ConfigDict, Field, computed_field
 
-from src.models.posts import Post
+from src.core.config import config
+from src.models.posts import Post, search_query
 from src.schemas.base import BaseFilter, UUIDstr
 from src.schemas.users import UserInfoSchema
 from src.utils import get_url
@@ -32,6 +33,11 @@ class PostRead(BasePost):
         return get_url('posts', uuid=self.uuid)
 
 
+class PostSearchRead(PostRead):
+    rank: float | None = None
+    snippet: str | None = None
+
+
 class PostCreate(BasePost):
     author_id: UUIDstr
 
@@ -69,3 +75,9 @@ class PostFilter(BaseFilter):
     class Constants(BaseFilter.Constants):
         model = Post
         search_model_fields = ['title']
+
+    def filter(self, query: Any) -> Any:
+        if self.search is None or len(self.search) < config.SEARCH_MIN_LENGTH:
+            return super().filter(query)
+        query = self.model_copy(update={'search': None}).filter(query)
+        return query.filter(Post.search_vector.bool_op('@@')(search_query(self.search)))
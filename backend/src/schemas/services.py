@@ -68,6 +68,10 @@ class ServiceAdminUpdate(ServiceUpdate):
     pass
 
 
+class ServiceBulkUpdate(BaseModel):
+    duration: Annotated[int, Field(ge=10)] | None = None
+
+
 class ServiceFilter(BaseFilter):
     name: str | None = None
     name__ilike: str | None = None
@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+from pydantic import UUID4, BaseModel, ConfigDict
+
+
+class DailyEntries(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    date: date
+    entries: int
+    completed: int
+
+
+class ServiceMinutes(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    service_id: UUID4
+    name: str
+    entries: int
+    minutes: int
+
+
+class WeeklyCount(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    week: date
+    count: int
+
+
+class Stats(BaseModel):
+    refreshed: datetime | None
+    completion_rate: float | None
+    entries_per_day: list[DailyEntries]
+    minutes_per_service: list[ServiceMinutes]
+    users_per_week: list[WeeklyCount]
+    posts_per_week: list[WeeklyCount]
@@ -121,6 +121,10 @@ class UserAdminUpdatePartial(BaseModel):
     admin: bool | None = None
 
 
+class UserBulkUpdate(BaseModel):
+    active: bool | None = None
+
+
 class UserInfoSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     uuid: Annotated[UUID4, AfterValidator(lambda x: str(x))] | str
@@ -134,6 +138,7 @@ class UserInfoSchema(BaseModel):
 
 class UserFilter(BaseFilter):
     email: str | None = None
+    email__ilike: str | None = None
     username: str | None = None
     username__ilike: str | None = None
     username__like: str | None = None
@@ -151,4 +156,4 @@ class UserFilter(BaseFilter):
 
     class Constants(BaseFilter.Constants):
         model = User
-        search_model_fields = ['username', 'uuid']
+        search_model_fields = ['username', 'email', 'uuid']
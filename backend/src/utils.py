@@ -1,6 +1,7 @@
 import re
 import secrets
 from enum import Enum
+from functools import cache
 from importlib import import_module
 from io import BytesIO
 from pathlib import Path
@@ -11,6 +12,7 @@ import filetype
 from fastapi import APIRouter, HTTPException, UploadFile, status
 from fastapi.logger import logger
 from PIL import Image
+from starlette.routing import NoMatchFound, Route
 
 from src.core.config import config
 
@@ -20,6 +22,11 @@ HTTP_403_FORBIDDEN = HTTPException(
     detail='You are not allowed to perform this operation',
 )
 
+HTTP_429_TOO_MANY_REQUESTS = HTTPException(
+    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+    detail='Too many requests',
+)
+
 PATTERNS = {
     'username': r'^[A-Za-z][A-Za-z0-9_.]*$',
     'youtube': r'(https?:\/\/)?(?:www.)?youtu((\.be)|(be\..{2,5}))\/((user)|(channel))\/',
@@ -45,6 +52,18 @@ class ImageType(str, Enum):
     POSTS = 'posts'
 
 
+class RateLimitKey(str, Enum):
+    IP = 'ip'
+    USER = 'user'
+    ACCOUNT = 'account'
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+
 def check_password_strength(password: str) -> None:
     error_log = []
     errors = {
@@ -60,14 +79,22 @@ def check_password_strength(password: str) -> None:
         raise ValueError(MESSAGE_PREFIX + ', '.join(err for err in error_log))
 
 
+@cache
+def url_template(module_name: str, endpoint: str = 'get_one') -> str:
+    module = import_module(f'src.api.v1.{module_name}')
+    router: APIRouter = getattr(module, 'router')
+    for route in router.routes:
+        if isinstance(route, Route) and route.name == endpoint:
+            return f'/api{route.path_format}'
+    raise NoMatchFound(endpoint, {})
+
+
 def get_url(
     module_name: str,
     endpoint: str = 'get_one',
     **path_params: Any,
 ) -> str:
-    module = import_module(f'src.api.v1.{module_name}')
-    router: APIRouter = getattr(module, 'router')
-    return f'/api{router.url_path_for(endpoint, **path_params)}'
+    return url_template(module_name, endpoint).format_map(path_params)
 
 
 def get_image(filename: str, *, path: ImageType) -> Path:
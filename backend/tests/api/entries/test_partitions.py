@@ -0,0 +1,62 @@
+from datetime import date, time
+
+import sqlalchemy as sa
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import engine
+from src.models.base import association_table
+from src.models.entries import Entry
+from src.models.services import Service
+from src.models.users import User
+from src.partitions import ARCHIVE_PARTITION, add_months, maintain, month_start, partition_name
+from src.schemas.auth import Token
+
+
+async def test_archive_completed_months(
+    verified_user: User,
+    service_list: list[Service],
+    admin_user_token: Token,
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+) -> None:
+    this_month = month_start(date.today())
+    months = [add_months(this_month, -15), add_months(this_month, -14), add_months(this_month, -13), this_month]
+    entries = [
+        Entry(date=month, time=time(10), user_id=verified_user.uuid, services=service_list, completed=completed)
+        for month, completed in zip(months, [True, False, True, False])
+    ]
+    async_session.add_all(entries)
+    await async_session.commit()
+
+    created, archived = await maintain(ahead=1, archive_after=12)
+    assert {partition_name(month) for month in months[:3]} <= set(created)
+    assert archived == [partition_name(months[0])]
+
+    entries[1].completed = True
+    await async_session.commit()
+    created, archived = await maintain(ahead=1, archive_after=12)
+    assert created == []
+    assert archived == [partition_name(month) for month in months[1:3]]
+
+    query = sa.select(Entry.uuid, sa.literal_column('entry.tableoid::regclass::text'))
+    partitions = dict((await async_session.execute(query)).tuples().all())
+    assert [partitions[entry.uuid] for entry in entries] == [ARCHIVE_PARTITION] * 3 + [partition_name(this_month)]
+    links = await async_session.scalar(
+        sa.select(sa.func.count()).where(association_table.c.entry_id.in_([entry.uuid for entry in entries]))
+    )
+    assert links == len(entries) * len(service_list)
+
+    resp = await async_client.get(
+        f'users/{verified_user.uuid}/entries', headers={'Authorization': f'Bearer {admin_user_token.access_token}'}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    items = resp.json()['items']
+    assert {item['uuid'] for item in items} == {str(entry.uuid) for entry in entries}
+    assert all(len(item['services']) == len(service_list) for item in items)
+
+    for entry in entries:
+        await async_session.delete(entry)
+    await async_session.commit()
+    await engine.dispose()
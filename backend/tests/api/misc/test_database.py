@@ -0,0 +1,150 @@
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.database import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    SessionRoute,
+    engine,
+    get_async_session,
+    pool_checked_out,
+    pool_connections,
+    pool_wait,
+    query_budget_exceeded,
+    repeated_queries,
+)
+from src.repositories.services import ServiceRepository
+from src.repositories.users import UserRepository
+from src.schemas.services import ServiceCreate, ServiceUpdatePartial
+
+
+async def test_engine_settings() -> None:
+    pool = engine.sync_engine.pool
+    assert pool.size() == config.POSTGRES_POOL_SIZE  # type: ignore[attr-defined]
+    assert pool._recycle == config.POSTGRES_POOL_RECYCLE
+    async with engine.connect() as conn:
+        assert await conn.scalar(sa.text('SHOW application_name')) == config.POSTGRES_APPLICATION_NAME
+        assert await conn.scalar(sa.text('SHOW statement_timeout')) == f'{config.POSTGRES_STATEMENT_TIMEOUT // 1000}s'
+        raw = await conn.get_raw_connection()
+        prepared = raw.dbapi_connection._prepared_statement_cache  # type: ignore[union-attr]
+        assert prepared.capacity == config.POSTGRES_PREPARED_STATEMENT_CACHE_SIZE
+    await engine.dispose()
+
+
+async def test_pool_metrics() -> None:
+    await engine.dispose()
+    connections = pool_connections.get()
+    waits = pool_wait.count()
+    checked_out = pool_checked_out.get()
+    async with engine.connect() as first, engine.connect() as second:
+        await first.execute(sa.text('SELECT 1'))
+        await second.execute(sa.text('SELECT 1'))
+        assert pool_checked_out.get() == checked_out + 2
+    assert pool_checked_out.get() == checked_out
+    assert pool_connections.get() == connections + 2
+    assert pool_wait.count() == waits + 2
+    await engine.dispose()
+
+
+async def test_writes_use_returning(async_session: AsyncSession) -> None:
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement.split(None, 1)[0])
+
+    repo, bind = ServiceRepository(async_session), async_session.get_bind()
+    sa.event.listen(bind, 'before_cursor_execute', record)
+    try:
+        service = await repo.create(ServiceCreate(name='round trip', duration=30))
+        created = service.created
+        await repo.update(service, ServiceUpdatePartial(duration=60), exclude_unset=True)
+    finally:
+        sa.event.remove(bind, 'before_cursor_execute', record)
+    assert statements == ['SELECT', 'INSERT', 'UPDATE']
+    assert service.duration == 60
+    assert service.updated > created
+    await repo.delete(service)
+
+
+async def test_hot_statements_reused(async_session: AsyncSession) -> None:
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    repo, bind = UserRepository(async_session), async_session.get_bind()
+    assert repo.select_by('uuid') is repo.select_by('uuid')
+    sa.event.listen(bind, 'before_cursor_execute', record)
+    try:
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await repo.find_by_uuid(uuid4())
+            with pytest.raises(HTTPException):
+                await repo.find_one(username=uuid4().hex)
+    finally:
+        sa.event.remove(bind, 'before_cursor_execute', record)
+    assert statements[:2] == statements[2:]
+
+
+async def test_session_released_before_response() -> None:
+    router = APIRouter(route_class=SessionRoute)
+    checked_out: list[float] = []
+
+    @router.get('/stream')
+    async def stream(session: AsyncSession = Depends(get_async_session)) -> StreamingResponse:
+        await session.execute(sa.text('SELECT 1'))
+        checked_out.append(pool_checked_out.get())
+
+        async def body() -> AsyncIterator[bytes]:
+            checked_out.append(pool_checked_out.get())
+            yield b'ok'
+
+        return StreamingResponse(body())
+
+    app = FastAPI()
+    app.include_router(router)
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        resp = await client.get('/stream')
+    assert resp.text == 'ok'
+    assert checked_out[1] == checked_out[0] - 1
+    await engine.dispose()
+
+
+async def test_query_budget(mocker: MockerFixture) -> None:
+    router = APIRouter(route_class=SessionRoute)
+
+    @router.get('/few', dependencies=[Depends(QueryBudget(2))])
+    async def few(session: AsyncSession = Depends(get_async_session)) -> int:
+        for _ in range(3):
+            await session.execute(sa.text('SELECT 1'))
+        return 3
+
+    @router.get('/repeated')
+    async def repeated(session: AsyncSession = Depends(get_async_session)) -> int:
+        for i in range(config.QUERY_REPEAT_THRESHOLD):
+            await session.execute(sa.text('SELECT CAST(:i AS int)'), {'i': i})
+        return config.QUERY_REPEAT_THRESHOLD
+
+    app = FastAPI()
+    app.include_router(router)
+    async with AsyncClient(app=app, base_url='http://test') as client:
+        with pytest.raises(QueryBudgetExceeded, match='GET /few: 3 queries, budget 2'):
+            await client.get('/few')
+        with pytest.raises(QueryBudgetExceeded, match='GET /repeated: 3 x SELECT'):
+            await client.get('/repeated')
+        mocker.patch.object(config, 'QUERY_BUDGET_ENFORCE', False)
+        exceeded, repeats = query_budget_exceeded.get(route='GET /few'), repeated_queries.get(route='GET /repeated')
+        assert (await client.get('/few')).json() == 3
+        assert (await client.get('/repeated')).json() == config.QUERY_REPEAT_THRESHOLD
+    assert query_budget_exceeded.get(route='GET /few') == exceeded + 1
+    assert repeated_queries.get(route='GET /repeated') == repeats + 1
+    await engine.dispose()
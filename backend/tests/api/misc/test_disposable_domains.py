@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from pytest_mock import MockerFixture
+
+from src.repositories.redis import DisposableDomains, RedisGuard
+
+
+@pytest.fixture(autouse=True)
+def email_guard(mocker: MockerFixture) -> RedisGuard:
+    guard = RedisGuard('test-email', timeout=0.1, fail_open=True)
+    mocker.patch('src.repositories.redis.email_guard', guard)
+    return guard
+
+
+async def test_load_seeds_redis(redis_client: FakeRedis, mocker: MockerFixture) -> None:
+    domains = DisposableDomains(refresh_interval=0)
+    mocker.patch.object(domains, 'redis', redis_client)
+    await domains.load()
+    assert 'user@Mailinator.com' in domains
+    assert 'user@user.com' not in domains
+    assert await redis_client.hexists('temp_domains', 'mailinator.com')
+    await redis_client.delete('temp_domains')
+
+
+async def test_refresh_picks_up_blocked_domains(redis_client: FakeRedis, mocker: MockerFixture) -> None:
+    domains = DisposableDomains(refresh_interval=0)
+    mocker.patch.object(domains, 'redis', redis_client)
+    await domains.load()
+    assert 'user@spam.example' not in domains
+    await redis_client.hset('blocked_domains', 'spam.example', 1)
+    await domains.refresh()
+    assert 'user@spam.example' in domains
+    await redis_client.delete('temp_domains', 'blocked_domains')
+
+
+async def test_refresh_keeps_domains_without_redis(redis_client: FakeRedis, mocker: MockerFixture) -> None:
+    domains = DisposableDomains(refresh_interval=0)
+    mocker.patch.object(domains, 'redis', redis_client)
+    await redis_client.hset('blocked_domains', 'spam.example', 1)
+    await domains.load()
+    server = FakeServer()
+    server.connected = False
+    mocker.patch.object(domains, 'redis', FakeRedis(server=server))
+    await domains.refresh()
+    assert 'user@spam.example' in domains
+    assert 'user@mailinator.com' in domains
+    await redis_client.delete('temp_domains', 'blocked_domains')
+
+
+async def test_periodic_refresh(redis_client: FakeRedis, mocker: MockerFixture) -> None:
+    domains = DisposableDomains(refresh_interval=0.01)
+    mocker.patch.object(domains, 'redis', redis_client)
+    refresh = mocker.spy(domains, 'refresh')
+    await domains.start()
+    await redis_client.hset('blocked_domains', 'spam.example', 1)
+    while refresh.call_count < 3:
+        await asyncio.sleep(0.01)
+    await domains.stop()
+    assert 'user@spam.example' in domains
+    await redis_client.delete('temp_domains', 'blocked_domains')
@@ -0,0 +1,142 @@
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from fakeredis.aioredis import FakeRedis
+from fastapi import status
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.models.posts import Post
+from src.pagination import page_counts
+from src.repositories.redis import RedisGuard, count_cache
+from src.schemas.auth import Token
+
+
+async def walk(async_client: AsyncClient, url: str, token: Token, **params: Any) -> list[dict[str, Any]]:
+    headers = {'Authorization': f'Bearer {token.access_token}'}
+    items: list[dict[str, Any]] = []
+    cursor = ''
+    while cursor is not None:
+        resp = await async_client.get(url, headers=headers, params={**params, 'cursor': cursor})
+        assert resp.status_code == status.HTTP_200_OK
+        page = resp.json()
+        assert page['total'] is None
+        items.extend(page['items'])
+        cursor = page['next_cursor']
+        assert (page['links']['next'] is None) == (cursor is None)
+    return items
+
+
+async def test_cursor_walks_all_posts(
+    post_list: list[Post], admin_user_token: Token, async_client: AsyncClient
+) -> None:
+    items = await walk(async_client, 'posts', admin_user_token, size=2)
+    assert [item['uuid'] for item in items] == sorted(str(post.uuid) for post in post_list)
+
+
+@pytest.mark.usefixtures('admin_user', 'verified_user', 'unverified_user', 'inactive_user')
+async def test_cursor_mixed_ordering(admin_user_token: Token, async_client: AsyncClient) -> None:
+    items = await walk(async_client, 'users', admin_user_token, size=1, order_by='-username,created')
+    resp = await async_client.get(
+        'users',
+        headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+        params={'size': 100, 'order_by': '-username,created'},
+    )
+    assert items == resp.json()['items']
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_invalid_cursor(admin_user_token: Token, async_client: AsyncClient) -> None:
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    resp = await async_client.get('posts', headers=headers, params={'cursor': 'garbage', 'size': 1})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert resp.json() == {'detail': 'Invalid cursor'}
+    resp = await async_client.get('posts', headers=headers, params={'cursor': '', 'size': 1})
+    cursor = resp.json()['next_cursor']
+    resp = await async_client.get('posts', headers=headers, params={'cursor': cursor, 'order_by': '-created'})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.usefixtures('admin_user')
+async def test_cursor_rejects_nullable_ordering(admin_user_token: Token, async_client: AsyncClient) -> None:
+    resp = await async_client.get(
+        'users',
+        headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+        params={'cursor': '', 'order_by': 'confirmed_on'},
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert resp.json() == {'detail': 'Cursor pagination does not support ordering by confirmed_on'}
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_offset_mode_counts(admin_user_token: Token, async_client: AsyncClient) -> None:
+    resp = await async_client.get(
+        'posts', headers={'Authorization': f'Bearer {admin_user_token.access_token}'}, params={'size': 1}
+    )
+    page = resp.json()
+    assert page['total'] == page['pages'] > 1
+    assert page['next_cursor'] is None
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_skip_total(admin_user_token: Token, async_client: AsyncClient) -> None:
+    exact = page_counts.get(strategy='exact')
+    resp = await async_client.get(
+        'posts',
+        headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+        params={'size': 1, 'include_total': False},
+    )
+    page = resp.json()
+    assert page['total'] is None
+    assert page['pages'] is None
+    assert page['links']['last'] is None
+    assert page['links']['next'] is not None
+    assert page_counts.get(strategy='exact') == exact
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_last_page_skips_count(admin_user_token: Token, async_client: AsyncClient) -> None:
+    exact = page_counts.get(strategy='exact')
+    resp = await async_client.get('posts', headers={'Authorization': f'Bearer {admin_user_token.access_token}'})
+    page = resp.json()
+    assert page['total'] == len(page['items'])
+    assert page['links']['next'] is None
+    assert page_counts.get(strategy='exact') == exact
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_filtered_count_cached(
+    admin_user_token: Token, async_client: AsyncClient, redis_client: FakeRedis, mocker: MockerFixture
+) -> None:
+    mocker.patch('src.repositories.redis.cache_guard', RedisGuard('test-counts', timeout=0.1, fail_open=True))
+    mocker.patch.object(count_cache, 'redis', redis_client)
+    exact, cached = page_counts.get(strategy='exact'), page_counts.get(strategy='cached')
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    params = {'size': 1, 'title__ilike': 'title%'}
+    first = await async_client.get('posts', headers=headers, params=params)
+    second = await async_client.get('posts', headers=headers, params={**params, 'page': 2})
+    assert first.json()['total'] == second.json()['total'] > 1
+    assert page_counts.get(strategy='exact') == exact + 1
+    assert page_counts.get(strategy='cached') == cached + 1
+    for key in await redis_client.keys('count:*'):
+        await redis_client.delete(key)
+
+
+async def test_unfiltered_count_estimated(
+    post_list: list[Post],
+    admin_user_token: Token,
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(config, 'POSTGRES_COUNT_ESTIMATE_THRESHOLD', 1)
+    await async_session.execute(sa.text('ANALYZE post'))
+    estimate = page_counts.get(strategy='estimate')
+    resp = await async_client.get(
+        'posts', headers={'Authorization': f'Bearer {admin_user_token.access_token}'}, params={'size': 1}
+    )
+    assert resp.json()['total'] == len(post_list)
+    assert page_counts.get(strategy='estimate') == estimate + 1
@@ -0,0 +1,165 @@
+import asyncio
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import HTTPException, Request, status
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from starlette.datastructures import FormData
+
+from src.api.v1.dependencies import RateLimit, login_limit
+from src.core.config import config
+from src.main import app
+from src.models.users import User
+from src.repositories.auth import AuthRepository
+from src.repositories.redis import LocalRateLimiter, local_rate_limiter, rate_limiter
+from src.utils import RateLimitKey
+from tests.utils import VERIFIED_USER
+
+
+KEY = 'rate_limit:test:local'
+
+
+async def test_local_rate_limiter_batches_hits(mock_rate_limiter: FakeRedis) -> None:
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=0.5)
+    assert not await limiter.is_rate_limited(KEY, 100, 60)
+    bucket = limiter.buckets[KEY]
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 1
+    assert bucket.tokens == 49
+    for _ in range(10):
+        assert not await limiter.is_rate_limited(KEY, 100, 60)
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 1
+    assert bucket.pending == 10
+    await limiter.sync()
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 11
+    assert bucket.pending == 0
+    await mock_rate_limiter.delete(bucket.window_key)
+
+
+async def test_local_rate_limiter_strict_near_limit(mock_rate_limiter: FakeRedis) -> None:
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=0.5)
+    results = [await limiter.is_rate_limited(KEY, 5, 60) for _ in range(8)]
+    assert results == [False] * 5 + [True] * 3
+    bucket = limiter.buckets[KEY]
+    assert bucket.tokens == 0
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 8
+    await mock_rate_limiter.delete(bucket.window_key)
+
+
+async def test_local_rate_limiter_cost(mock_rate_limiter: FakeRedis) -> None:
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=1)
+    assert not await limiter.is_rate_limited(KEY, 10, 60, cost=4)
+    assert not await limiter.is_rate_limited(KEY, 10, 60, cost=4)
+    assert await limiter.is_rate_limited(KEY, 10, 60, cost=4)
+    await mock_rate_limiter.delete(limiter.buckets[KEY].window_key)
+
+
+async def test_local_rate_limiter_sync_race(mock_rate_limiter: FakeRedis, mocker: MockerFixture) -> None:
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=0.5)
+    release = asyncio.Event()
+    hit_many = rate_limiter.hit_many
+
+    async def slow_hit_many(*args: Any) -> list[int] | None:
+        await release.wait()
+        return await hit_many(*args)
+
+    mocker.patch.object(rate_limiter, 'hit_many', side_effect=slow_hit_many)
+    for _ in range(11):
+        assert not await limiter.is_rate_limited(KEY, 100, 60)
+    bucket = limiter.buckets[KEY]
+    task = asyncio.create_task(limiter.sync())
+    await asyncio.sleep(0)
+    assert bucket.pending == 0
+    for _ in range(40):
+        assert not await limiter.is_rate_limited(KEY, 100, 60)
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 41
+    release.set()
+    await task
+    await limiter.sync()
+    assert bucket.pending == 0
+    assert int(await mock_rate_limiter.get(bucket.window_key)) == 51
+    await mock_rate_limiter.delete(bucket.window_key)
+
+
+async def test_local_rate_limiter_window_rollover(mock_rate_limiter: FakeRedis, mocker: MockerFixture) -> None:
+    clock = mocker.patch('src.repositories.redis.time')
+    clock.time.return_value = 600
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=0.5)
+    for _ in range(6):
+        assert not await limiter.is_rate_limited(KEY, 100, 60)
+    old_bucket = limiter.buckets[KEY]
+    assert old_bucket.pending == 5
+    clock.time.return_value = 660
+    assert not await limiter.is_rate_limited(KEY, 100, 60)
+    await limiter.sync()
+    assert int(await mock_rate_limiter.get(old_bucket.window_key)) == 6
+    assert not limiter.retired
+    await mock_rate_limiter.delete(old_bucket.window_key, limiter.buckets[KEY].window_key)
+
+
+def make_request(token: str | None = None, form: dict[str, str] | None = None) -> Request:
+    headers = [(b'authorization', f'Bearer {token}'.encode())] if token else []
+    request = Request({'type': 'http', 'method': 'POST', 'path': '/', 'headers': headers, 'client': ('10.0.0.1', 0)})
+    if form is not None:
+        request._form = FormData(form)
+    return request
+
+
+@pytest.mark.parametrize(
+    'key, token, form, identity',
+    [
+        (RateLimitKey.IP, None, None, 'ip:10.0.0.1'),
+        (RateLimitKey.USER, None, None, 'ip:10.0.0.1'),
+        (RateLimitKey.USER, 'fake_token', None, 'ip:10.0.0.1'),
+        (RateLimitKey.ACCOUNT, None, {'username': 'Alice'}, 'account:alice'),
+        (RateLimitKey.ACCOUNT, None, {}, 'ip:10.0.0.1'),
+    ],
+)
+async def test_rate_limit_identify(
+    key: RateLimitKey, token: str | None, form: dict[str, str] | None, identity: str
+) -> None:
+    policy = RateLimit('test', 10, 60, key=key)
+    assert await policy.identify(make_request(token, form)) == identity
+
+
+async def test_rate_limit_identify_user(verified_user: User) -> None:
+    token = AuthRepository.create_token(verified_user)
+    policy = RateLimit('test', 10, 60, key=RateLimitKey.USER)
+    assert await policy.identify(make_request(token)) == f'user:{verified_user.uuid}'
+
+
+async def test_rate_limit_cost(mock_rate_limiter: FakeRedis, mocker: MockerFixture) -> None:
+    mocker.patch.object(local_rate_limiter, 'buckets', {})
+    mocker.patch.object(local_rate_limiter, 'retired', [])
+    cheap = RateLimit('test-cost', 10, 60)
+    expensive = cheap.with_cost(4)
+    request = make_request()
+    await expensive(request)
+    await expensive(request)
+    await cheap(request)
+    await cheap(request)
+    with pytest.raises(HTTPException) as exc:
+        await cheap(request)
+    assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    for key in await mock_rate_limiter.keys('rate_limit:test-cost:*'):
+        await mock_rate_limiter.delete(key)
+
+
+@pytest.mark.usefixtures('verified_user')
+async def test_login_limit_counts_failed_logins(
+    async_client: AsyncClient, mock_rate_limiter: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delitem(app.dependency_overrides, login_limit)
+    credentials = {'username': VERIFIED_USER['username'], 'password': VERIFIED_USER['password']}
+    for _ in range(config.LOGIN_MAX_ATTEMPTS + 1):
+        resp = await async_client.post('auth/token', data=credentials)
+        assert resp.status_code == status.HTTP_200_OK
+    for i in range(config.LOGIN_MAX_ATTEMPTS):
+        login = VERIFIED_USER['username'] if i % 2 else VERIFIED_USER['email']
+        resp = await async_client.post('auth/token', data={'username': login, 'password': 'wrong'})
+        assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+    resp = await async_client.post('auth/token', data=credentials)
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    for key in await mock_rate_limiter.keys('rate_limit:login:*'):
+        await mock_rate_limiter.delete(key)
@@ -0,0 +1,79 @@
+from typing import Any
+
+import redis.asyncio as aioredis
+from pytest_mock import MockerFixture
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.sentinel import SentinelConnectionPool
+
+from src.core.config import config
+from src.repositories.redis import create_redis, get_redis, parse_nodes
+
+
+SENTINELS = ['10.0.0.1:26379', '10.0.0.2:26379', '10.0.0.3:26379']
+MASTER_STATE = {
+    'ip': '10.0.0.5',
+    'port': 6379,
+    'is_master': True,
+    'is_sdown': False,
+    'is_odown': False,
+    'num-other-sentinels': 2,
+}
+
+
+def test_parse_nodes() -> None:
+    assert parse_nodes(SENTINELS) == [('10.0.0.1', 26379), ('10.0.0.2', 26379), ('10.0.0.3', 26379)]
+
+
+def test_shared_client() -> None:
+    assert get_redis() is get_redis()
+
+
+def test_standalone_pool_settings(mocker: MockerFixture) -> None:
+    mocker.patch.object(config, 'REDIS_MAX_CONNECTIONS', 7)
+    mocker.patch.object(config, 'REDIS_SOCKET_TIMEOUT', 1.5)
+    mocker.patch.object(config, 'REDIS_HEALTH_CHECK_INTERVAL', 10)
+    mocker.patch.object(config, 'REDIS_RETRIES', 2)
+    client = create_redis()
+    pool = client.connection_pool
+    assert pool.max_connections == 7
+    assert pool.connection_kwargs['socket_timeout'] == 1.5
+    assert pool.connection_kwargs['socket_keepalive'] is True
+    assert pool.connection_kwargs['health_check_interval'] == 10
+    assert pool.connection_kwargs['retry']._retries == 2
+
+
+async def test_sentinel_discovers_master(mocker: MockerFixture) -> None:
+    mocker.patch.object(config, 'REDIS_MODE', 'sentinel')
+    mocker.patch.object(config, 'REDIS_SENTINELS', SENTINELS)
+    client = create_redis()
+    pool = client.connection_pool
+    assert isinstance(pool, SentinelConnectionPool)
+    assert pool.service_name == config.REDIS_SENTINEL_MASTER
+    sentinel: Any = pool.sentinel_manager
+    assert [node.connection_pool.connection_kwargs['host'] for node in sentinel.sentinels] == [
+        '10.0.0.1',
+        '10.0.0.2',
+        '10.0.0.3',
+    ]
+    down, *up = sentinel.sentinels
+    mocker.patch.object(down, 'sentinel_masters', mocker.AsyncMock(side_effect=aioredis.ConnectionError('refused')))
+    for node in up:
+        mocker.patch.object(
+            node, 'sentinel_masters', mocker.AsyncMock(return_value={config.REDIS_SENTINEL_MASTER: MASTER_STATE})
+        )
+    assert await pool.get_master_address() == ('10.0.0.5', 6379)
+    assert sentinel.sentinels[0].connection_pool.connection_kwargs['host'] == '10.0.0.2'
+
+
+def test_cluster_startup_nodes(mocker: MockerFixture) -> None:
+    mocker.patch.object(config, 'REDIS_MODE', 'cluster')
+    mocker.patch.object(config, 'REDIS_CLUSTER_NODES', ['10.0.1.1:7000', '10.0.1.2:7001', '10.0.1.3:7002'])
+    mocker.patch.object(config, 'REDIS_MAX_CONNECTIONS', 9)
+    client: Any = create_redis()
+    assert isinstance(client, RedisCluster)
+    assert [node.name for node in client.nodes_manager.startup_nodes.values()] == [
+        '10.0.1.1:7000',
+        '10.0.1.2:7001',
+        '10.0.1.3:7002',
+    ]
+    assert client.nodes_manager.connection_kwargs['max_connections'] == 9
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any
+
+import pytest
+import redis.asyncio as aioredis
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from fastapi import HTTPException, status
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from src.repositories.redis import (
+    GuardedRedisBackend,
+    LocalRateLimiter,
+    RedisGuard,
+    RedisRepository,
+    circuit_transitions,
+    rate_limiter,
+)
+from src.schemas.auth import Token
+from src.utils import CircuitState
+
+
+async def failing_operation() -> Any:
+    raise aioredis.ConnectionError('Connection refused')
+
+
+async def slow_operation() -> Any:
+    await asyncio.sleep(1)
+
+
+async def successful_operation() -> Any:
+    return 'ok'
+
+
+def disconnected_redis() -> FakeRedis:
+    server = FakeServer()
+    server.connected = False
+    return FakeRedis(server=server)
+
+
+async def test_guard_opens_after_failures() -> None:
+    guard = RedisGuard('test-open', timeout=0.1, fail_open=True, failure_threshold=2, recovery_time=60)
+    assert await guard.run(failing_operation, 'default') == 'default'
+    assert guard.state is CircuitState.CLOSED
+    assert await guard.run(failing_operation, 'default') == 'default'
+    assert guard.state is CircuitState.OPEN
+    assert await guard.run(successful_operation, 'default') == 'default'
+    assert circuit_transitions.get(feature='test-open', state='open') == 1
+
+
+async def test_guard_half_open() -> None:
+    guard = RedisGuard('test-half-open', timeout=0.1, fail_open=True, failure_threshold=1, recovery_time=0)
+    await guard.run(failing_operation, None)
+    assert guard.state is CircuitState.OPEN
+    await guard.run(failing_operation, None)
+    assert guard.state is CircuitState.OPEN
+    assert await guard.run(successful_operation, None) == 'ok'
+    assert guard.state is CircuitState.CLOSED
+
+
+async def test_guard_timeout() -> None:
+    guard = RedisGuard('test-timeout', timeout=0.01, fail_open=True, failure_threshold=1, recovery_time=60)
+    assert await guard.run(slow_operation, 'default') == 'default'
+    assert guard.state is CircuitState.OPEN
+
+
+async def test_guard_fail_closed() -> None:
+    guard = RedisGuard('test-closed', timeout=0.1, fail_open=False, failure_threshold=1, recovery_time=60)
+    with pytest.raises(HTTPException) as exc:
+        await guard.run(failing_operation, None)
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+async def test_guard_half_open_cancelled() -> None:
+    guard = RedisGuard('test-cancelled', timeout=1, fail_open=True, failure_threshold=1, recovery_time=0)
+    await guard.run(failing_operation, None)
+    task = asyncio.create_task(guard.run(slow_operation, None))
+    await asyncio.sleep(0)
+    assert guard.state is CircuitState.HALF_OPEN
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert guard.state is CircuitState.OPEN
+    assert await guard.run(successful_operation, None) == 'ok'
+    assert guard.state is CircuitState.CLOSED
+
+
+async def test_guarded_cache_backend_fails_open(mocker: MockerFixture) -> None:
+    guard = RedisGuard('test-cache', timeout=0.1, fail_open=True, failure_threshold=1, recovery_time=60)
+    mocker.patch('src.repositories.redis.cache_guard', guard)
+    backend = GuardedRedisBackend(disconnected_redis())
+    await backend.set('key', b'value', 60)
+    assert await backend.get('key') is None
+    assert await backend.get_with_ttl('key') == (0, None)
+    assert await backend.clear('namespace') == 0
+    assert guard.state is CircuitState.OPEN
+
+
+async def test_guarded_cache_backend(redis_client: FakeRedis, mocker: MockerFixture) -> None:
+    mocker.patch('src.repositories.redis.cache_guard', RedisGuard('test-cache-ok', timeout=0.1, fail_open=True))
+    backend = GuardedRedisBackend(redis_client)
+    await backend.set('key', b'value', 60)
+    assert await backend.get('key') == b'value'
+
+
+async def test_redis_repository_tokens_fail_closed(mocker: MockerFixture) -> None:
+    guard = RedisGuard('test-tokens', timeout=0.1, fail_open=False, failure_threshold=1, recovery_time=60)
+    mocker.patch('src.repositories.redis.tokens_guard', guard)
+    repo = RedisRepository(redis=disconnected_redis())
+    for operation in (repo.get_token('token'), repo.delete_token('token')):
+        with pytest.raises(HTTPException) as exc:
+            await operation
+        assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+async def test_redis_repository_tokens_fail_open(mocker: MockerFixture) -> None:
+    guard = RedisGuard('test-tokens-open', timeout=0.1, fail_open=True, failure_threshold=1, recovery_time=60)
+    mocker.patch('src.repositories.redis.tokens_guard', guard)
+    repo = RedisRepository(redis=disconnected_redis())
+    assert await repo.get_token('token') is None
+    assert guard.state is CircuitState.OPEN
+
+
+async def test_local_rate_limiter_admits_on_redis_failure(mocker: MockerFixture) -> None:
+    mocker.patch.object(rate_limiter, 'hit', return_value=None)
+    limiter = LocalRateLimiter(rate_limiter, sync_interval=1, error_bound=0.5)
+    assert all([not await limiter.is_rate_limited('rate_limit:test:down', 2, 60) for _ in range(5)])
+
+
+async def test_metrics(async_client: AsyncClient, admin_user_token: Token) -> None:
+    guard = RedisGuard('test-metrics', timeout=0.1, fail_open=True, failure_threshold=1, recovery_time=60)
+    await guard.run(failing_operation, None)
+    resp = await async_client.get(
+        'http://testserver/metrics', headers={'Authorization': f'Bearer {admin_user_token.access_token}'}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert 'redis_circuit_state{feature="test-metrics"} 1' in resp.text
+
+
+async def test_metrics_non_admin(async_client: AsyncClient, verified_user_token: Token) -> None:
+    resp = await async_client.get(
+        'http://testserver/metrics', headers={'Authorization': f'Bearer {verified_user_token.access_token}'}
+    )
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
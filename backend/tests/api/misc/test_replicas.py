@@ -0,0 +1,77 @@
+from typing import AsyncGenerator
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+from fakeredis.aioredis import FakeRedis
+from fastapi import status
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.config import config
+from src.database import Base, async_session_maker, engine, get_async_session
+from src.main import app
+from src.models.posts import Post
+from src.models.users import User
+from src.repositories.redis import RedisGuard, primary_pins
+from src.schemas.auth import Token
+from tests.utils import ADMIN_USER, create_user
+
+
+REPLICA_DB = f'{config.POSTGRES_DB}_replica'
+
+
+@pytest.fixture(scope='function')
+async def replica(mocker: MockerFixture, redis_client: FakeRedis) -> AsyncGenerator[AsyncEngine, None]:
+    server = create_async_engine(config.POSTGRES_DSN, isolation_level='AUTOCOMMIT', poolclass=NullPool)
+    async with server.connect() as conn:
+        await conn.execute(sa.text(f'DROP DATABASE IF EXISTS {REPLICA_DB}'))
+        await conn.execute(sa.text(f'CREATE DATABASE {REPLICA_DB}'))
+    dsn = make_url(config.POSTGRES_DSN).set(database=REPLICA_DB)
+    replica_engine = create_async_engine(dsn, poolclass=NullPool)
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    mocker.patch('src.database.replica_engines', [replica_engine])
+    mocker.patch('src.repositories.redis.cache_guard', RedisGuard('test-pins', timeout=0.1, fail_open=True))
+    mocker.patch.object(primary_pins, 'redis', redis_client)
+    yield replica_engine
+    await replica_engine.dispose()
+    await engine.dispose()
+    async with server.connect() as conn:
+        await conn.execute(sa.text(f'DROP DATABASE {REPLICA_DB}'))
+    await server.dispose()
+    for key in await redis_client.keys('primary_pin:*'):
+        await redis_client.delete(key)
+
+
+async def test_routing_session(replica: AsyncEngine) -> None:
+    async with async_session_maker(info={'replica': True}) as session:
+        bind = session.sync_session.get_bind
+        assert bind(clause=sa.select(User)) is replica.sync_engine
+        assert bind(clause=sa.select(User).with_for_update()) is engine.sync_engine
+        assert bind(clause=sa.update(User).values(active=False)) is engine.sync_engine
+    async with async_session_maker(info={'replica': False}) as session:
+        assert session.sync_session.get_bind(clause=sa.select(User)) is engine.sync_engine
+
+
+async def test_reads_pinned_after_write(
+    replica: AsyncEngine,
+    post_list: list[Post],
+    admin_user_token: Token,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with AsyncSession(replica) as session:
+        await create_user(ADMIN_USER, session)
+    monkeypatch.delitem(app.dependency_overrides, get_async_session)
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    resp = await async_client.get('posts', headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()['total'] == 0
+    resp = await async_client.delete(f'posts/{uuid4()}', headers=headers)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    resp = await async_client.get('posts', headers=headers)
+    assert resp.json()['total'] == len(post_list)
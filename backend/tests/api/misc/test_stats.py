@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import engine
+from src.models.posts import Post
+from src.models.users import User
+from src.repositories.stats import StatsRefresher
+from src.schemas.auth import Token
+from tests.utils import EntryFactory
+
+
+@pytest.mark.parametrize('entry_factory', [4], indirect=True)
+async def test_get_stats(
+    post_list: list[Post],
+    verified_user: User,
+    admin_user_token: Token,
+    verified_user_token: Token,
+    entry_factory: EntryFactory,
+    async_session: AsyncSession,
+    async_client: AsyncClient,
+) -> None:
+    async for entries in await entry_factory(verified_user, async_session):
+        assert await StatsRefresher(0).refresh(force=True)
+        resp = await async_client.get('stats', headers={'Authorization': f'Bearer {admin_user_token.access_token}'})
+        assert resp.status_code == status.HTTP_200_OK
+        stats = resp.json()
+        assert stats['refreshed'] is not None
+        assert stats['completion_rate'] == 0
+        assert sum(day['entries'] for day in stats['entries_per_day']) == len(entries)
+        assert sum(row['minutes'] for row in stats['minutes_per_service']) == sum(e.duration for e in entries)
+        assert sum(week['count'] for week in stats['posts_per_week']) == len(post_list)
+        assert sum(week['count'] for week in stats['users_per_week']) >= 2
+
+        start = min(entry.date for entry in entries) + timedelta(days=1)
+        resp = await async_client.get(
+            'stats',
+            headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+            params={'start': start.isoformat(), 'end': (date.today() + timedelta(days=60)).isoformat()},
+        )
+        days = resp.json()['entries_per_day']
+        assert sum(day['entries'] for day in days) == len([entry for entry in entries if entry.date >= start])
+
+        resp = await async_client.get('stats', headers={'Authorization': f'Bearer {verified_user_token.access_token}'})
+        assert resp.status_code == status.HTTP_403_FORBIDDEN
+    await engine.dispose()
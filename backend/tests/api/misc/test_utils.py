@@ -6,6 +6,7 @@ from typing import Any
 
 import pytest
 from fastapi import HTTPException
+from starlette.routing import NoMatchFound
 
 from src.core.config import config
 from src.utils import (
@@ -15,6 +16,7 @@ from src.utils import (
     delete_image,
     get_image,
     get_url,
+    url_template,
 )
 from tests.utils import VERSION, ImageFactory
 
@@ -49,6 +51,13 @@ def test_get_url(module: str) -> None:
     assert get_url(module, uuid=UUID) == f'/{VERSION}{module}/{UUID}'
 
 
+def test_url_template() -> None:
+    assert url_template('users', 'get_user_entries') is url_template('users', 'get_user_entries')
+    assert get_url('entries', 'get_by_date', date='2030-01-31') == f'/{VERSION}entries/date/2030-01-31'
+    with pytest.raises(NoMatchFound):
+        url_template('users', 'missing')
+
+
 @pytest.mark.parametrize('image_type', ['posts', 'profiles'])
 def test_get_image(image_type: str) -> None:
     img_path = config.ROOT_DIR / config.UPLOAD_DIR / ImageType(image_type).value
@@ -193,3 +193,59 @@ async def test_delete_one(
             headers={'Authorization': f'Bearer {verified_user_token.access_token}'},
         )
         assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.parametrize('image_factory', ['posts'], indirect=True)
+async def test_delete_many(
+    admin_user: User,
+    admin_user_token: Token,
+    verified_user_token: Token,
+    image_factory: ImageFactory[Post],
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    data = {'title': 'test_title', 'content': 'test_content', 'author_id': admin_user.uuid}
+    async for _, img_path, post in await image_factory(instance=Post(**data), async_session=async_session):
+        resp = await async_client.delete(
+            'posts',
+            headers={'Authorization': f'Bearer {verified_user_token.access_token}'},
+            params={'uuid__in': post.uuid},
+        )
+        assert resp.status_code == status.HTTP_403_FORBIDDEN
+        headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+        resp = await async_client.delete('posts', headers=headers)
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        assert resp.json() == {'detail': 'Provide uuids or a filter'}
+        resp = await async_client.delete('posts', headers=headers, params={'title': data['title']})
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.json() == {'affected': 1}
+        assert await async_session.scalar(sa.select(Post).filter_by(uuid=post.uuid)) is None
+        assert not Path.exists(img_path)
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_search(admin_user_token: Token, async_client: AsyncClient) -> None:
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    resp = await async_client.get('posts/search', headers=headers, params={'q': 'content 2'})
+    assert resp.status_code == status.HTTP_200_OK
+    items = resp.json()['items']
+    assert [item['title'] for item in items] == ['title 2']
+    assert items[0]['rank'] > 0
+    assert items[0]['snippet'] == '<mark>content</mark> <mark>2</mark>'
+    resp = await async_client.get('posts/search', headers=headers, params={'q': 'title 3 or title 1'})
+    assert sorted(item['title'] for item in resp.json()['items']) == ['title 1', 'title 3']
+    resp = await async_client.get('posts/search', headers=headers, params={'q': '4'})
+    items = resp.json()['items']
+    assert [item['title'] for item in items] == ['title 4']
+    assert items[0]['rank'] is None
+    resp = await async_client.get('posts/search', headers=headers, params={'q': 'content', 'cursor': ''})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.usefixtures('post_list')
+async def test_search_filter(admin_user_token: Token, async_client: AsyncClient) -> None:
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    resp = await async_client.get('posts', headers=headers, params={'search': 'title 5'})
+    assert [item['title'] for item in resp.json()['items']] == ['title 5']
+    resp = await async_client.get('posts', headers=headers, params={'search': 'e '})
+    assert resp.json()['total'] == len(POSTS)
@@ -164,3 +164,23 @@ async def test_delete_one(
         headers={'Authorization': f'Bearer {verified_user_token.access_token}'},
     )
     assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_patch_many(
+    admin_user_token: Token,
+    service_list: list[Service],
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    headers = {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    params = {'uuid__in': ','.join(str(service.uuid) for service in service_list[:2])}
+    resp = await async_client.patch('services', json={}, headers=headers, params=params)
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert resp.json() == {'detail': 'Nothing to update'}
+    resp = await async_client.patch('services', json={'duration': 45}, headers=headers, params=params)
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == {'affected': 2}
+    durations = await async_session.scalars(
+        sa.select(Service.duration).filter(Service.uuid.in_(params['uuid__in'].split(',')))
+    )
+    assert set(durations) == {45}
@@ -5,10 +5,12 @@ import pytest
 import sqlalchemy as sa
 from fastapi import status
 from httpx import AsyncClient
+from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import config
 from src.models.users import User
+from src.repositories.users import UserRepository
 from src.schemas.auth import Token
 from src.schemas.socials import SocialRead
 from src.schemas.users import UserRead
@@ -112,6 +114,74 @@ async def test_patch_one(
     assert verified_user.created == old_data['created']
 
 
+async def test_patch_one_uniqueness(
+    admin_user_token: Token,
+    verified_user: User,
+    second_verified_user: User,
+    async_client: AsyncClient,
+) -> None:
+    url, headers = f'users/{verified_user.uuid}', {'Authorization': f'Bearer {admin_user_token.access_token}'}
+    resp = await async_client.patch(url, json={'username': second_verified_user.username.upper()}, headers=headers)
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert resp.json() == {'detail': 'Please choose a different username'}
+    resp = await async_client.patch(url, json={'username': 'j_hn'}, headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+    resp = await async_client.patch(url, json={'username': 'J_HN'}, headers=headers)
+    assert resp.status_code == status.HTTP_200_OK
+
+
+async def test_patch_one_integrity_error(
+    admin_user_token: Token,
+    verified_user: User,
+    second_verified_user: User,
+    async_client: AsyncClient,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(UserRepository, 'verify_uniqueness')
+    resp = await async_client.patch(
+        f'users/{verified_user.uuid}',
+        json={'email': second_verified_user.email.upper()},
+        headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+    )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert resp.json() == {'detail': 'Please choose a different email'}
+
+
+async def test_patch_many(
+    admin_user: User,
+    admin_user_token: Token,
+    verified_user: User,
+    second_verified_user: User,
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+) -> None:
+    resp = await async_client.patch(
+        'users',
+        json={'active': False},
+        headers={'Authorization': f'Bearer {admin_user_token.access_token}'},
+        params={'uuid__in': f'{verified_user.uuid},{second_verified_user.uuid},{admin_user.uuid}'},
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json() == {'affected': 2}
+    for user in (verified_user, second_verified_user, admin_user):
+        await async_session.refresh(user)
+    assert verified_user.active is second_verified_user.active is False
+    assert admin_user.active is True
+
+
+@pytest.mark.parametrize(
+    'search, expected',
+    [('LIC', ['alice']), ('john.c', ['john']), ('950F8C5F-ad', ['alice']), ('%', []), ('5ad2209z', [])],
+)
+@pytest.mark.usefixtures('verified_user', 'second_verified_user')
+async def test_search(admin_user_token: Token, async_client: AsyncClient, search: str, expected: list[str]) -> None:
+    resp = await async_client.get(
+        'users', headers={'Authorization': f'Bearer {admin_user_token.access_token}'}, params={'search': search}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert [item['username'] for item in resp.json()['items']] == expected
+
+
 async def test_delete_one(
     admin_user: User,
     admin_user_token: Token,
@@ -13,6 +13,7 @@ from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from src.api.v1.dependencies import RateLimit
 from src.core.config import config
 from src.database import Base, get_async_session
 from src.main import app
@@ -56,6 +57,8 @@ async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
 
 app.dependency_overrides[get_async_session] = override_get_async_session
 app.dependency_overrides[get_redis] = lambda: fake_redis_client
+for policy in RateLimit.registry:
+    app.dependency_overrides[policy] = lambda: None
 
 
 @pytest.fixture(scope='function')
@@ -70,6 +73,11 @@ def mock_rate_limiter(mocker: MockerFixture) -> fakeredis.aioredis.FakeRedis:
     return redis_mock
 
 
+@pytest.fixture(autouse=True, scope='function')
+def enforce_query_budget(mocker: MockerFixture) -> None:
+    mocker.patch.object(config, 'QUERY_BUDGET_ENFORCE', True)
+
+
 async def drop_all() -> None:
     async with engine_test.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)